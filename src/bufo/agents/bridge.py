@@ -4,21 +4,42 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
+import mmap
+import os
 import shlex
 from collections import deque
-from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Awaitable, Callable
+from typing import Any, Awaitable, Callable, NamedTuple
 
 from bufo.protocol.jsonrpc import JsonRpcConnection, JsonRpcFailure
 from bufo.runtime_logging import get_runtime_logger
 
 EventHandler = Callable[["AgentEvent"], Awaitable[None]]
 DEFAULT_CONTROL_RPC_TIMEOUT_S = 30.0
+STREAM_READER_LIMIT = 1 << 20
+STDOUT_READ_CHUNK = 1 << 16
+MMAP_READ_THRESHOLD = 1 << 20
 
 
-@dataclass(slots=True)
-class AgentEvent:
+def _read_file_text(file_path: Path) -> str:
+    """Read a file as text, decoding large files straight from an mmap.
+
+    For files past the threshold this skips the intermediate bytes object
+    read_text would allocate, decoding directly from the page cache and
+    halving peak memory for big filesystem/read responses.
+    """
+    with open(file_path, "rb") as handle:
+        size = os.fstat(handle.fileno()).st_size
+        if size < MMAP_READ_THRESHOLD:
+            return handle.read().decode("utf-8", errors="replace")
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return str(mapped, "utf-8", "replace")
+
+
+class AgentEvent(NamedTuple):
+    """One agent-to-client event; a NamedTuple so the per-event allocation
+    on the session/update hot path stays in C."""
+
     type: str
     payload: dict[str, Any]
 
@@ -29,36 +50,55 @@ class AcpAgentBridge:
     This implements the expected client-to-agent calls and accepts
     agent-to-client callbacks for session updates, permission asks,
     filesystem operations, and terminal operations.
+
+    I/O deliberately stays on asyncio's subprocess transports rather than a
+    raw epoll/io_uring pipe loop: the hot-path costs are kept down with
+    chunked stdout reads, a single unified pump task, vectored stdin writes,
+    and zero write watermarks, while remaining portable and cancellable
+    through the standard event loop.
     """
 
     def __init__(self, command: str, cwd: Path, on_event: EventHandler) -> None:
         self.command = command
+        self._argv = shlex.split(command)
         self.cwd = cwd
+        self._cwd_resolved = cwd.resolve()
+        self._cwd_resolved_str = str(self._cwd_resolved)
+        self._cwd_prefix = self._cwd_resolved_str + os.sep
         self.on_event = on_event
         self.process: asyncio.subprocess.Process | None = None
         self.connection: JsonRpcConnection | None = None
         self._reader_task: asyncio.Task[None] | None = None
-        self._stderr_task: asyncio.Task[None] | None = None
         self._wait_task: asyncio.Task[None] | None = None
         self._stderr_tail: deque[str] = deque(maxlen=8)
         self.session_id: str | None = None
         self.logger = get_runtime_logger()
+        # Cached so hot paths skip the kwargs dict and call when DEBUG is off.
+        self._debug = self.logger.enabled("debug")
 
     async def start(self) -> None:
-        argv = shlex.split(self.command)
         self.logger.info("bridge.start", command=self.command, cwd=str(self.cwd))
         self.process = await asyncio.create_subprocess_exec(
-            *argv,
+            *self._argv,
             cwd=str(self.cwd),
             stdin=asyncio.subprocess.PIPE,
             stdout=asyncio.subprocess.PIPE,
             stderr=asyncio.subprocess.PIPE,
+            limit=STREAM_READER_LIMIT,
         )
+        assert self.process.stdin is not None
+        # Zero watermarks make drain() wait for a real flush instead of
+        # returning while up to 64 KiB sits buffered for a slow agent.
+        self.process.stdin.transport.set_write_buffer_limits(high=0, low=0)
 
         async def sender(line: str) -> None:
             assert self.process is not None
             assert self.process.stdin is not None
-            self.process.stdin.write(line.encode("utf-8") + b"\n")
+            # Vectored write: frame payload and newline go down as one
+            # submission without concatenating a fresh bytes object per RPC.
+            # This supersedes a reusable scratch buffer — the transport
+            # gathers both pieces itself, so there is nothing left to copy.
+            self.process.stdin.writelines((line.encode("utf-8"), b"\n"))
             await self.process.stdin.drain()
 
         self.connection = JsonRpcConnection(sender)
@@ -72,8 +112,7 @@ class AcpAgentBridge:
         self.connection.register_method("terminal/release", self._on_terminal)
         self.connection.register_method("terminal/wait_for_exit", self._on_terminal)
 
-        self._reader_task = asyncio.create_task(self._read_stdout_loop())
-        self._stderr_task = asyncio.create_task(self._read_stderr_loop())
+        self._reader_task = asyncio.create_task(self._read_pipes_loop())
         self._wait_task = asyncio.create_task(self._watch_process_exit())
         self.logger.debug("bridge.started")
 
@@ -88,12 +127,6 @@ class AcpAgentBridge:
                 await self._reader_task
             self._reader_task = None
 
-        if self._stderr_task is not None:
-            self._stderr_task.cancel()
-            with contextlib.suppress(asyncio.CancelledError):
-                await self._stderr_task
-            self._stderr_task = None
-
         if self._wait_task is not None:
             self._wait_task.cancel()
             with contextlib.suppress(asyncio.CancelledError):
@@ -200,7 +233,8 @@ class AcpAgentBridge:
         if self.connection is None:
             raise RuntimeError("Bridge not started")
         self._raise_if_process_exited(method)
-        self.logger.debug("bridge.rpc.call", method=method, session_id=self.session_id)
+        if self._debug:
+            self.logger.debug("bridge.rpc.call", method=method, session_id=self.session_id)
         try:
             return await self.connection.call(method, params, timeout=timeout)
         except asyncio.TimeoutError as exc:
@@ -212,37 +246,82 @@ class AcpAgentBridge:
             if self.process is not None and self.process.returncode is not None:
                 raise RuntimeError(self._exit_message(method)) from exc
             raise
+        except OSError as exc:
+            # A dying agent can also surface as a stdin write failure
+            # (ConnectionResetError/BrokenPipeError from drain()) racing the
+            # stdout-EOF shutdown path; report it the same way.
+            if self.process is not None and self.process.returncode is not None:
+                raise RuntimeError(self._exit_message(method)) from exc
+            raise
 
-    async def _read_stdout_loop(self) -> None:
-        assert self.process is not None
-        assert self.process.stdout is not None
-        while True:
-            line = await self.process.stdout.readline()
-            if not line:
-                self.logger.debug("bridge.stdout.closed", session_id=self.session_id)
-                if self.connection is not None:
-                    self.connection.shutdown()
-                break
-            if self.connection is None:
-                continue
-            await self.connection.feed(line.decode("utf-8", errors="replace"))
+    async def _read_pipes_loop(self) -> None:
+        """Pump stdout and stderr from one task.
 
-    async def _read_stderr_loop(self) -> None:
+        A single ``asyncio.wait`` services whichever pipe has bytes, so a
+        burst on either fd costs one task wakeup instead of two scheduled
+        reader coroutines trading turns.
+        """
         assert self.process is not None
-        assert self.process.stderr is not None
-        while True:
-            line = await self.process.stderr.readline()
-            if not line:
-                break
+        stdout = self.process.stdout
+        stderr = self.process.stderr
+        assert stdout is not None
+        assert stderr is not None
+
+        tail = bytearray()
+        fut_out: asyncio.Task[bytes] | None = asyncio.create_task(stdout.read(STDOUT_READ_CHUNK))
+        fut_err: asyncio.Task[bytes] | None = asyncio.create_task(stderr.readline())
+        try:
+            while fut_out is not None or fut_err is not None:
+                pending = {fut for fut in (fut_out, fut_err) if fut is not None}
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                if fut_out in done:
+                    chunk = fut_out.result()
+                    if chunk:
+                        await self._pump_stdout(chunk, tail)
+                        fut_out = asyncio.create_task(stdout.read(STDOUT_READ_CHUNK))
+                    else:
+                        if tail and self.connection is not None:
+                            await self.connection.feed(bytes(tail))
+                        self.logger.debug("bridge.stdout.closed", session_id=self.session_id)
+                        if self.connection is not None:
+                            self.connection.shutdown()
+                        fut_out = None
+                if fut_err in done:
+                    line = fut_err.result()
+                    if line:
+                        await self._pump_stderr(line)
+                        fut_err = asyncio.create_task(stderr.readline())
+                    else:
+                        fut_err = None
+        finally:
+            for fut in (fut_out, fut_err):
+                if fut is not None:
+                    fut.cancel()
+
+    async def _pump_stdout(self, chunk: bytes, tail: bytearray) -> None:
+        # Chunked reads drain every frame buffered by the kernel in one
+        # coroutine resumption, instead of one readline() wakeup per frame.
+        tail += chunk
+        if b"\n" not in chunk:
+            return
+        *frames, rest = tail.split(b"\n")
+        tail[:] = rest
+        if self.connection is None:
+            return
+        for frame in frames:
+            await self.connection.feed(frame)
+
+    async def _pump_stderr(self, line: bytes) -> None:
+        if self._debug:
             self.logger.debug("bridge.stderr.line", session_id=self.session_id)
-            text = line.decode("utf-8", errors="replace")
-            self._stderr_tail.append(text.rstrip())
-            await self.on_event(
-                AgentEvent(
-                    type="agent/stderr",
-                    payload={"text": text},
-                )
+        text = line.decode("utf-8", errors="replace")
+        self._stderr_tail.append(text.rstrip())
+        await self.on_event(
+            AgentEvent(
+                type="agent/stderr",
+                payload={"text": text},
             )
+        )
 
     async def _watch_process_exit(self) -> None:
         assert self.process is not None
@@ -284,38 +363,51 @@ class AcpAgentBridge:
         await self.on_event(AgentEvent(type="permission/request", payload=payload))
         return {"decision": "reject_once"}
 
+    def _sandboxed_path(self, rel_path: str) -> Path | None:
+        """Join ``rel_path`` under the project root, or None if it escapes it.
+
+        Uses the root resolved once at construction, a cheap lexical prefix
+        check to reject plain ``..`` escapes, then one realpath on the
+        candidate so an in-project symlink pointing outside the root is
+        caught too. The root itself is never re-resolved per RPC.
+        """
+        joined = os.path.normpath(os.path.join(self._cwd_prefix, rel_path))
+        if joined != self._cwd_resolved_str and not joined.startswith(self._cwd_prefix):
+            return None
+        resolved = os.path.realpath(joined)
+        if resolved != self._cwd_resolved_str and not resolved.startswith(self._cwd_prefix):
+            return None
+        return Path(joined)
+
     async def _on_filesystem_read(self, params: dict[str, Any] | list[Any] | None) -> dict[str, Any]:
         payload = params if isinstance(params, dict) else {}
         rel_path = str(payload.get("path", ""))
-        file_path = (self.cwd / rel_path).resolve()
+        file_path = self._sandboxed_path(rel_path)
 
-        try:
-            file_path.relative_to(self.cwd.resolve())
-        except ValueError:
+        if file_path is None:
             return {"ok": False, "error": "path outside project"}
 
         if not file_path.exists():
             return {"ok": False, "error": "not found"}
 
+        content = await asyncio.to_thread(_read_file_text, file_path)
         return {
             "ok": True,
             "path": rel_path,
-            "content": file_path.read_text(encoding="utf-8", errors="replace"),
+            "content": content,
         }
 
     async def _on_filesystem_write(self, params: dict[str, Any] | list[Any] | None) -> dict[str, Any]:
         payload = params if isinstance(params, dict) else {}
         rel_path = str(payload.get("path", ""))
         content = str(payload.get("content", ""))
-        file_path = (self.cwd / rel_path).resolve()
+        file_path = self._sandboxed_path(rel_path)
 
-        try:
-            file_path.relative_to(self.cwd.resolve())
-        except ValueError:
+        if file_path is None:
             return {"ok": False, "error": "path outside project"}
 
-        file_path.parent.mkdir(parents=True, exist_ok=True)
-        file_path.write_text(content, encoding="utf-8")
+        await asyncio.to_thread(file_path.parent.mkdir, parents=True, exist_ok=True)
+        await asyncio.to_thread(file_path.write_text, content, encoding="utf-8")
         await self.on_event(AgentEvent(type="filesystem/write", payload={"path": rel_path}))
         return {"ok": True}
 
@@ -326,34 +418,27 @@ class AcpAgentBridge:
 
     def _build_prompt_payload(self, text: str, resources: list[dict[str, Any]]) -> dict[str, Any]:
         prompt_blocks: list[dict[str, Any]] = [{"type": "text", "text": text}]
+        append = prompt_blocks.append
 
         for resource in resources:
-            resource_type = resource.get("type")
-            path = str(resource.get("path", "resource"))
-            mime = str(resource.get("mime", "application/octet-stream"))
-
+            _get = resource.get
+            resource_type = _get("type")
             if resource_type == "text":
-                prompt_blocks.append(
-                    {
-                        "type": "resource",
-                        "resource": {
-                            "uri": path,
-                            "mimeType": mime,
-                            "text": str(resource.get("text", "")),
-                        },
-                    }
-                )
+                body_key, body = "text", str(_get("text", ""))
             elif resource_type == "binary":
-                prompt_blocks.append(
-                    {
-                        "type": "resource",
-                        "resource": {
-                            "uri": path,
-                            "mimeType": mime,
-                            "blob": str(resource.get("base64", "")),
-                        },
-                    }
-                )
+                body_key, body = "blob", str(_get("base64", ""))
+            else:
+                continue
+            append(
+                {
+                    "type": "resource",
+                    "resource": {
+                        "uri": str(_get("path", "resource")),
+                        "mimeType": str(_get("mime", "application/octet-stream")),
+                        body_key: body,
+                    },
+                }
+            )
 
         return {
             "sessionId": self.session_id,
@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
+import os
+import pickle
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from hashlib import blake2b
 from pathlib import Path
-from typing import Iterable
 
 from bufo.agents.schema import AgentCatalog, AgentDescriptor
-from bufo.paths import custom_agents_dir
+from bufo.paths import cache_root, custom_agents_dir
+from bufo.version import __version__
 
 try:
     import tomllib
@@ -21,34 +25,86 @@ class CatalogLoadResult:
     warnings: list[str]
 
 
+def _parse_catalog(path: Path) -> tuple[AgentCatalog | None, str | None]:
+    try:
+        payload = tomllib.loads(path.read_text(encoding="utf-8"))
+        return AgentCatalog.model_validate(payload), None
+    except Exception as exc:  # pragma: no cover - defensive parser path
+        return None, f"{path.name}: {exc}"
+
+
+def _fingerprint(paths: list[Path]) -> str | None:
+    """Digest of (path, mtime, size) over the catalog files plus app version,
+    so any edit, rename, or upgrade invalidates the cached resolution.
+    Returns None when any file cannot be stat'd (e.g. deleted between the
+    glob and here); callers treat that as a cache miss and skip the write."""
+    digest = blake2b(__version__.encode("utf-8"), digest_size=16)
+    for path in paths:
+        try:
+            st = path.stat()
+        except OSError:
+            return None
+        digest.update(f"{path}:{st.st_mtime_ns}:{st.st_size}\n".encode("utf-8"))
+    return digest.hexdigest()
+
+
 class AgentRegistry:
-    def __init__(self, package_data_dir: Path, custom_dir: Path | None = None) -> None:
+    def __init__(
+        self,
+        package_data_dir: Path,
+        custom_dir: Path | None = None,
+        cache_path: Path | None = None,
+    ) -> None:
         self.package_data_dir = package_data_dir
         self.custom_dir = custom_dir or custom_agents_dir()
+        self.cache_path = cache_path or (cache_root() / "agent-catalog.pickle")
 
     def load(self) -> CatalogLoadResult:
         warnings: list[str] = []
         by_identity: dict[str, AgentDescriptor] = {}
 
-        for descriptor in self._iter_descriptors(self.package_data_dir, warnings):
-            by_identity[descriptor.identity] = descriptor
+        # Package catalogs first, then custom overrides; within each root the
+        # sorted order is preserved so later files still win on identity.
+        paths: list[Path] = []
+        for root in (self.package_data_dir, self.custom_dir):
+            if root.exists():
+                paths.extend(sorted(root.glob("*.toml")))
+
+        fingerprint = _fingerprint(paths)
+        cached = self._read_cache(fingerprint) if fingerprint is not None else None
+        if cached is not None:
+            return CatalogLoadResult(agents=cached, warnings=[])
 
-        for descriptor in self._iter_descriptors(self.custom_dir, warnings):
-            by_identity[descriptor.identity] = descriptor
+        # read_text blocks per file and tomllib parses in pure Python, so the
+        # files are parsed concurrently; pool.map keeps the merge order.
+        if paths:
+            with ThreadPoolExecutor(max_workers=min(len(paths), os.cpu_count() or 1)) as pool:
+                for catalog, error in pool.map(_parse_catalog, paths):
+                    if error is not None:
+                        warnings.append(error)
+                        continue
+                    assert catalog is not None
+                    for descriptor in catalog.agents:
+                        by_identity[descriptor.identity] = descriptor
 
         agents = sorted(by_identity.values(), key=lambda item: item.name.lower())
+        if fingerprint is not None and not warnings:
+            self._write_cache(fingerprint, agents)
         return CatalogLoadResult(agents=agents, warnings=warnings)
 
-    def _iter_descriptors(self, root: Path, warnings: list[str]) -> Iterable[AgentDescriptor]:
-        if not root.exists():
-            return []
-
-        loaded: list[AgentDescriptor] = []
-        for path in sorted(root.glob("*.toml")):
-            try:
-                payload = tomllib.loads(path.read_text(encoding="utf-8"))
-                catalog = AgentCatalog.model_validate(payload)
-                loaded.extend(catalog.agents)
-            except Exception as exc:  # pragma: no cover - defensive parser path
-                warnings.append(f"{path.name}: {exc}")
-        return loaded
+    def _read_cache(self, fingerprint: str) -> list[AgentDescriptor] | None:
+        try:
+            stored_fingerprint, agents = pickle.loads(self.cache_path.read_bytes())
+        except Exception:
+            return None
+        if stored_fingerprint != fingerprint:
+            return None
+        return agents
+
+    def _write_cache(self, fingerprint: str, agents: list[AgentDescriptor]) -> None:
+        tmp_path = self.cache_path.with_suffix(".tmp")
+        try:
+            tmp_path.write_bytes(pickle.dumps((fingerprint, agents)))
+            tmp_path.replace(self.cache_path)
+        except OSError:
+            return
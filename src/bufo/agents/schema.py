@@ -4,18 +4,25 @@ from __future__ import annotations
 
 from typing import Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 Platform = Literal["linux", "darwin", "windows", "default"]
 
 
-class AgentAction(BaseModel):
+class _CatalogModel(BaseModel):
+    """Shared config: core schemas are built lazily on first validation so
+    importing this module does not pay for catalog models never loaded."""
+
+    model_config = ConfigDict(defer_build=True)
+
+
+class AgentAction(_CatalogModel):
     name: str
     description: str = ""
     commands: dict[Platform, str] = Field(default_factory=dict)
 
 
-class AgentDescriptor(BaseModel):
+class AgentDescriptor(_CatalogModel):
     identity: str
     name: str
     protocol: str = "acp"
@@ -28,10 +35,11 @@ class AgentDescriptor(BaseModel):
     welcome_markdown: str | None = None
 
     def command_for_platform(self, platform: str) -> str | None:
-        if platform in self.run_command:
-            return self.run_command[platform]  # type: ignore[index]
-        return self.run_command.get("default")
+        command = self.run_command.get(platform)  # type: ignore[call-overload]
+        if command is None:
+            command = self.run_command.get("default")
+        return command
 
 
-class AgentCatalog(BaseModel):
+class AgentCatalog(_CatalogModel):
     agents: list[AgentDescriptor]
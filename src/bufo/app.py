@@ -3,12 +3,14 @@
 from __future__ import annotations
 
 import asyncio
+import json
 import os
 import sys
 import time
 from pathlib import Path
 from typing import Any, Callable
 
+import httpx
 from textual import events
 from textual.app import App, ComposeResult, UnknownModeError
 from textual.css.query import NoMatches
@@ -21,6 +23,7 @@ from bufo.config.store import SettingsStore
 from bufo.fs.watch import NullWatchManager, WatchManager
 from bufo.messages import CreateSession, LaunchAgent, OpenSessions, OpenSettings, ResumeAgent, SwitchSession
 from bufo.notifications import NotificationEvent, Notifier
+from bufo.paths import cache_root
 from bufo.persistence.sessions import SessionStore
 from bufo.runtime_logging import configure_runtime_logging, get_runtime_logger
 from bufo.screens.main import MainScreen
@@ -112,14 +115,24 @@ class BufoApp(App[None]):
                     errno=getattr(exc, "errno", None),
                     error=str(exc),
                 )
-        self._last_copied_selection: str | None = None
+        # (len, hash) of the last copied selection: enough to dedupe repeat
+        # mouse-ups without keeping the whole selection text alive.
+        self._last_copied_key: tuple[int, int] | None = None
         self._last_copied_at = 0.0
 
         data_dir = Path(__file__).resolve().parent / "data" / "agents"
         self.registry = AgentRegistry(package_data_dir=data_dir)
-        loaded = self.registry.load()
-        self.catalog = loaded.agents
-        self.catalog_warnings = loaded.warnings
+        # Catalog loading is filesystem I/O; it runs in on_mount on a worker
+        # thread so the first paint does not wait on disk.
+        self.catalog: list[AgentDescriptor] = []
+        self.catalog_warnings: list[str] = []
+        self._catalog_by_identity: dict[str, AgentDescriptor] = {}
+        # identity -> descriptor with run_command pinned to this platform;
+        # memoized so repeat launches skip pydantic model_copy validation.
+        self._agent_variants: dict[str, AgentDescriptor] = {}
+        # Shared HTTP client so repeat checks reuse pooled TCP/TLS
+        # connections; created lazily on first use, closed in on_exit.
+        self._http: httpx.AsyncClient | None = None
 
         self.notifier = Notifier(self.settings.notifications)
         self.telemetry = Telemetry(self.settings)
@@ -136,24 +149,45 @@ class BufoApp(App[None]):
         yield Header(show_clock=True)
         yield StoreScreen(
             agents=self.catalog,
-            recent_sessions=self.session_store.recent(limit=50),
+            recent_sessions=[],
             project_root=self.project_root,
             id="store",
-        )
+        )  # catalog and recents start empty; on_mount fills them off-thread
         yield Footer()
 
     async def on_mount(self) -> None:
         self.theme = self.settings.appearance.theme
+
+        set_loop = getattr(self.watch_manager, "set_loop", None)
+        if set_loop is not None:
+            set_loop(asyncio.get_running_loop())
+
+        if not self.catalog:  # a pre-populated catalog (tests, embedders) wins
+            loaded = await asyncio.to_thread(self.registry.load)
+            self.catalog = loaded.agents
+            self.catalog_warnings = loaded.warnings
+            self._catalog_by_identity = {agent.identity: agent for agent in self.catalog}
+            try:
+                self.query_one(StoreScreen).refresh_catalog(self.catalog)
+            except NoMatches:  # pragma: no cover - store screen replaced by a mode
+                pass
+
         self.logger.info("app.mounted", theme=self.theme, catalog_size=len(self.catalog))
 
         if self.catalog_warnings:
-            for warning in self.catalog_warnings:
-                self.notify(f"Catalog warning: {warning}", severity="warning")
+            # One toast for the lot: per-warning notify() triggers a Textual
+            # refresh each, which stalls mount on large broken catalogs.
+            count = len(self.catalog_warnings)
+            preview = "; ".join(self.catalog_warnings[:3])
+            if count > 3:
+                preview += " …"
+            self.notify(f"Catalog warnings ({count}): {preview}", severity="warning")
 
         if self._watcher_startup_error is not None:
             self.notify(self._watcher_startup_message(), severity="warning")
 
         self.telemetry.capture(TelemetryEvent(name="app_start", properties={"version": __version__}))
+        asyncio.create_task(self._background_load_recent_sessions())
         if self.check_updates:
             asyncio.create_task(self._background_version_check())
 
@@ -167,15 +201,47 @@ class BufoApp(App[None]):
                 resume_session_id=self.resume_session_id,
             )
 
+    async def _background_load_recent_sessions(self) -> None:
+        recent = await asyncio.to_thread(self.session_store.recent, 50)
+        try:
+            self.query_one(StoreScreen).refresh_recent_sessions(recent)
+        except NoMatches:  # pragma: no cover - store screen replaced by a mode
+            pass
+
     async def _background_version_check(self) -> None:
         self.logger.debug("app.update_check.start")
-        latest = await check_for_update("bufo")
+        cache_path = cache_root() / "version_check.json"
+        hit, latest = self._cached_version_check(cache_path)
+        if not hit:
+            if self._http is None:
+                self._http = httpx.AsyncClient(
+                    timeout=5.0,
+                    limits=httpx.Limits(max_keepalive_connections=4),
+                )
+            latest = await check_for_update("bufo", client=self._http)
+            try:
+                cache_path.write_text(json.dumps({"latest": latest}), encoding="utf-8")
+            except OSError:  # pragma: no cover - cache dir unwritable
+                pass
         if latest:
             self.notify(f"Update available: {latest}", severity="information")
             self.logger.info("app.update_check.available", latest=latest)
         else:
             self.logger.debug("app.update_check.none")
 
+    @staticmethod
+    def _cached_version_check(cache_path: Path) -> tuple[bool, str | None]:
+        """Return (hit, latest) from the on-disk check result, treating
+        entries older than 24h (and unreadable files) as misses."""
+        try:
+            if time.time() - cache_path.stat().st_mtime >= 86400:
+                return False, None
+            payload = json.loads(cache_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return False, None
+        latest = payload.get("latest") if isinstance(payload, dict) else None
+        return True, latest if isinstance(latest, str) else None
+
     async def on_launch_agent(self, message: LaunchAgent) -> None:
         self.logger.info(
             "app.launch_agent.requested",
@@ -246,8 +312,14 @@ class BufoApp(App[None]):
             )
             return
 
-        platform_name = _platform_name()
-        command = agent.command_for_platform(platform_name) or agent.command_for_platform("default")
+        variant = self._agent_variants.get(agent.identity)
+        if variant is None:
+            platform_name = _platform_name()
+            command = agent.command_for_platform(platform_name) or agent.command_for_platform("default")
+            variant = agent.model_copy(update={
+                "run_command": {"default": command} if command else {},
+            })
+            self._agent_variants[agent.identity] = variant
 
         session = self.session_tracker.create(
             title=agent.name,
@@ -269,13 +341,11 @@ class BufoApp(App[None]):
 
         self.add_mode(
             session.mode_name,
-            lambda session=session, project_root=project_root, agent=agent, command=command, resume_session_id=resume_session_id: MainScreen(
+            lambda session=session, project_root=project_root, variant=variant, resume_session_id=resume_session_id: MainScreen(
                 session=session,
                 project_root=project_root,
                 settings=self.settings,
-                agent=agent.model_copy(update={
-                    "run_command": {"default": command} if command else {},
-                }),
+                agent=variant,
                 resume_session_id=resume_session_id,
                 watch_manager=self.watch_manager,
                 bridge_factory=self.bridge_factory,
@@ -297,6 +367,12 @@ class BufoApp(App[None]):
         )
 
     def _resolve_agent(self, identity: str) -> AgentDescriptor | None:
+        agent = self._catalog_by_identity.get(identity)
+        if agent is not None:
+            return agent
+
+        # Catalogs swapped in wholesale (tests, embedders) bypass the index;
+        # fall back to a scan before declaring the identity unknown.
         for agent in self.catalog:
             if agent.identity == identity:
                 return agent
@@ -365,20 +441,20 @@ class BufoApp(App[None]):
         if not sessions:
             return
 
-        mode_names = [session.mode_name for session in sessions]
-        if self.current_mode not in mode_names:
-            self.switch_mode(mode_names[0])
+        idx = self.session_tracker.mode_name_index().get(self.current_mode)
+        if idx is None:
+            self.switch_mode(sessions[0].mode_name)
             return
 
-        idx = mode_names.index(self.current_mode)
-        next_idx = (idx + delta) % len(mode_names)
+        next_idx = (idx + delta) % len(sessions)
+        target_mode = sessions[next_idx].mode_name
         self.logger.debug(
             "app.action_step_session",
             delta=delta,
             current_mode=self.current_mode,
-            target_mode=mode_names[next_idx],
+            target_mode=target_mode,
         )
-        self.switch_mode(mode_names[next_idx])
+        self.switch_mode(target_mode)
 
     def _refresh_store_screen(self) -> None:
         try:
@@ -390,7 +466,15 @@ class BufoApp(App[None]):
 
     def on_exit(self) -> None:
         self.settings_store.save(self.settings)
+        self.settings_store.flush()
+        if self._http is not None:
+            try:
+                asyncio.get_running_loop().create_task(self._http.aclose())
+            except RuntimeError:  # pragma: no cover - loop already gone
+                pass
+            self._http = None
         self.telemetry.capture(TelemetryEvent(name="app_exit", properties={"mode": self.current_mode}))
+        self.telemetry.flush()
         self.logger.info("app.exit", mode=self.current_mode)
         self.watch_manager.close()
 
@@ -404,12 +488,13 @@ class BufoApp(App[None]):
             return False
 
         now = time.monotonic()
-        if selected == self._last_copied_selection and (now - self._last_copied_at) < 0.5:
+        key = (len(selected), hash(selected))
+        if key == self._last_copied_key and (now - self._last_copied_at) < 0.5:
             return False
 
         system_clipboard_ok = self._copy_to_system_clipboard(selected)
         self.copy_to_clipboard(selected)
-        self._last_copied_selection = selected
+        self._last_copied_key = key
         self._last_copied_at = now
         if system_clipboard_ok:
             self.notify("Copied selection to clipboard", severity="information")
@@ -476,11 +561,18 @@ class AcpCommandApp(BufoApp):
         )
 
 
+# sys.platform and os.name never change within a process, so the branch
+# ladder runs once at import.
+_PLATFORM_NAME = (
+    "linux"
+    if sys.platform.startswith("linux")
+    else "darwin"
+    if sys.platform == "darwin"
+    else "windows"
+    if os.name == "nt"
+    else "default"
+)
+
+
 def _platform_name() -> str:
-    if sys.platform.startswith("linux"):
-        return "linux"
-    if sys.platform == "darwin":
-        return "darwin"
-    if os.name == "nt":
-        return "windows"
-    return "default"
+    return _PLATFORM_NAME
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+from collections import deque
 from pathlib import Path
 
 import click
@@ -187,9 +188,14 @@ def replay(path: str, limit: int) -> None:
     if not file_path.exists():
         raise click.ClickException(f"File not found: {file_path}")
 
-    lines = file_path.read_text(encoding="utf-8", errors="replace").splitlines()
-    for line in lines[-limit:]:
-        click.echo(line)
+    # Bounded deque instead of read_text: keeps at most `limit` lines in
+    # memory no matter how large the log has grown.
+    tail: deque[str] = deque(maxlen=max(limit, 0))
+    with file_path.open("r", encoding="utf-8", errors="replace", buffering=1 << 20) as stream:
+        for line in stream:
+            tail.append(line)
+    for line in tail:
+        click.echo(line.rstrip("\n"))
 
 
 def _serve_app(
@@ -66,6 +66,10 @@ class PathsSettings(BaseModel):
     @field_validator("project_root")
     @classmethod
     def validate_path(cls, value: str) -> str:
+        # Already-expanded absolute paths (the common case on reload) pass
+        # through without building a Path.
+        if value.startswith("/") or (len(value) > 1 and value[1] == ":"):
+            return value
         path = Path(value).expanduser()
         return str(path)
 
@@ -87,12 +91,15 @@ class AppSettings(BaseModel):
 
         result: list[tuple[str, str]] = []
 
+        # One model_dump up front, then a pure dict walk: dumping inside the
+        # recursion re-serialized whole subtrees at every level, and the
+        # nested dicts it produced stopped the flattening one level deep.
         def walk(prefix: str, value: object) -> None:
-            if isinstance(value, BaseModel):
-                for key, nested in value.model_dump().items():
+            if isinstance(value, dict):
+                for key, nested in value.items():
                     walk(f"{prefix}.{key}" if prefix else key, nested)
             else:
                 result.append((prefix, str(value)))
 
-        walk("", self)
+        walk("", self.model_dump(mode="python"))
         return result
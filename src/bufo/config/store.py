@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import json
+import os
+import threading
 from pathlib import Path
 from typing import Any
 
@@ -11,33 +13,105 @@ from pydantic import ValidationError
 from bufo.config.models import AppSettings
 from bufo.paths import settings_path
 
+try:
+    import orjson
+except Exception:  # pragma: no cover - optional runtime fallback
+    orjson = None
+
 
 class SettingsStore:
     def __init__(self, path: Path | None = None) -> None:
         self.path = path or settings_path()
+        # Parsed-settings cache keyed on file mtime: repeat load() calls are
+        # a stat() instead of a read+parse+validate cycle.
+        self._cached: AppSettings | None = None
+        self._mtime_ns: int | None = None
+        # Write-behind state: save() updates the cache immediately but
+        # coalesces disk writes over a short window, so bursts of edits from
+        # the settings screen rewrite the file once instead of per edit.
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._flush_timer: threading.Timer | None = None
+
+    FLUSH_DELAY_S = 0.15
 
     def load(self) -> AppSettings:
-        if not self.path.exists():
+        try:
+            stat = self.path.stat()
+        except OSError:
             settings = AppSettings()
             self.save(settings)
             return settings
 
-        raw = self.path.read_text(encoding="utf-8")
+        if self._cached is not None and stat.st_mtime_ns == self._mtime_ns:
+            return self._cached
+
+        raw = self.path.read_bytes()
         try:
-            data = json.loads(raw)
-            return AppSettings.model_validate(data)
-        except (json.JSONDecodeError, ValidationError):
+            # orjson parses bytes directly, skipping a separate UTF-8 decode.
+            data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+            settings = AppSettings.model_validate(data)
+        except (ValueError, ValidationError):
             # Fall back to defaults while preserving corrupt payload for debugging.
             backup = self.path.with_suffix(".corrupt.json")
-            backup.write_text(raw, encoding="utf-8")
+            backup.write_bytes(raw)
             settings = AppSettings()
             self.save(settings)
+            # Pin the cache to the still-corrupt file's mtime so repeat
+            # load() calls before the deferred write don't re-run recovery.
+            self._mtime_ns = stat.st_mtime_ns
             return settings
 
+        self._cached = settings
+        self._mtime_ns = stat.st_mtime_ns
+        return settings
+
     def save(self, settings: AppSettings) -> None:
+        self._cached = settings
+        if not self.path.exists():
+            # First write creates the file synchronously so callers can rely
+            # on it existing right after the defaults are materialized.
+            self._write(settings)
+            return
+
+        with self._lock:
+            self._dirty = True
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+            timer = threading.Timer(self.FLUSH_DELAY_S, self.flush)
+            timer.daemon = True
+            self._flush_timer = timer
+            timer.start()
+
+    def flush(self) -> None:
+        """Write any pending save to disk now; safe to call when clean."""
+        with self._lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            if not self._dirty:
+                return
+            self._dirty = False
+            settings = self._cached
+        if settings is not None:
+            self._write(settings)
+
+    def _write(self, settings: AppSettings) -> None:
         self.path.parent.mkdir(parents=True, exist_ok=True)
-        payload = json.dumps(settings.model_dump(mode="json"), indent=2, sort_keys=True)
-        self.path.write_text(f"{payload}\n", encoding="utf-8")
+        # indent/sort stay: the file is user-facing and hand-editable.
+        data = settings.model_dump(mode="json")
+        if orjson is not None:
+            payload = orjson.dumps(data, option=orjson.OPT_SORT_KEYS | orjson.OPT_INDENT_2)
+        else:
+            payload = json.dumps(data, indent=2, sort_keys=True).encode("utf-8")
+        # Atomic replace so a crash mid-write never leaves a torn file.
+        tmp_path = self.path.with_suffix(".tmp")
+        tmp_path.write_bytes(payload + b"\n")
+        os.replace(tmp_path, self.path)
+        try:
+            self._mtime_ns = self.path.stat().st_mtime_ns
+        except OSError:  # pragma: no cover - file removed between write and stat
+            self._mtime_ns = None
 
     def update(self, dotted_key: str, value: Any) -> AppSettings:
         settings = self.load()
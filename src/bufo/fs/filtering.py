@@ -2,35 +2,118 @@
 
 from __future__ import annotations
 
+import re
+from functools import lru_cache
 from pathlib import Path
 
 import pathspec
 
+_BASE_PATTERNS = (".git/", ".venv/", "node_modules/")
 
-class PathFilter:
-    def __init__(self, project_root: Path) -> None:
-        self.project_root = project_root.resolve()
-        self._spec = self._build_spec()
 
-    def _build_spec(self) -> pathspec.PathSpec:
-        patterns: list[str] = [".git/", ".venv/", "node_modules/"]
+class _CompiledSpec:
+    """Ignore spec collapsed into one alternation regex, so matching a
+    path is a single C-level regex call instead of a Python loop over
+    every pattern. Only valid for specs without negated (!) patterns —
+    _load_spec falls back to _OrderedSpec when any are present, because
+    collapsing cannot preserve gitignore's last-match-wins ordering."""
+
+    __slots__ = ("_ignore",)
+
+    def __init__(self, ignore: re.Pattern[str] | None) -> None:
+        self._ignore = ignore
+
+    def match_file(self, rel_text: str) -> bool:
+        return self._ignore is not None and self._ignore.match(rel_text) is not None
+
+    def match_files(self, rel_texts: list[str]) -> list[str]:
+        match_file = self.match_file
+        return [text for text in rel_texts if match_file(text)]
+
+
+class _OrderedSpec:
+    """Last-match-wins evaluation via pathspec, for specs that contain
+    negated patterns; same interface as _CompiledSpec."""
+
+    __slots__ = ("_spec",)
+
+    def __init__(self, spec: pathspec.PathSpec) -> None:
+        self._spec = spec
+
+    def match_file(self, rel_text: str) -> bool:
+        return self._spec.match_file(rel_text)
+
+    def match_files(self, rel_texts: list[str]) -> list[str]:
+        match_file = self._spec.match_file
+        return [text for text in rel_texts if match_file(text)]
 
-        root = self.project_root
-        for parent in [root, *root.parents]:
-            gitignore = parent / ".gitignore"
-            if not gitignore.exists():
+
+def _gitignore_state(root: Path) -> tuple[tuple[str, int], ...]:
+    """(path, mtime_ns) for each .gitignore the spec is built from; doubles
+    as the cache key, so an edited file changes the key and misses."""
+    state: list[tuple[str, int]] = []
+    for parent in [root, *root.parents]:
+        gitignore = parent / ".gitignore"
+        try:
+            mtime_ns = gitignore.stat().st_mtime_ns
+        except OSError:
+            continue
+        state.append((str(gitignore), mtime_ns))
+        if parent == root:
+            break
+    return tuple(state)
+
+
+@lru_cache(maxsize=32)
+def _load_spec(state: tuple[tuple[str, int], ...]) -> _CompiledSpec | _OrderedSpec:
+    patterns: list[str] = list(_BASE_PATTERNS)
+    for path_text, _mtime_ns in state:
+        try:
+            raw = Path(path_text).read_text(encoding="utf-8", errors="replace")
+        except OSError:
+            continue
+        for line in raw.splitlines():
+            line = line.strip()
+            if not line or line.startswith("#"):
                 continue
+            patterns.append(line)
 
-            for line in gitignore.read_text(encoding="utf-8", errors="replace").splitlines():
-                line = line.strip()
-                if not line or line.startswith("#"):
-                    continue
-                patterns.append(line)
+    spec = pathspec.PathSpec.from_lines("gitwildmatch", patterns)
+    if any(not pattern.include for pattern in spec.patterns if pattern.regex is not None):
+        # Negations make ordering significant; let pathspec evaluate the
+        # patterns in sequence. Almost no .gitignore uses them, so the
+        # collapsed fast path below still covers the common case.
+        return _OrderedSpec(spec)
+
+    ignore_parts: list[str] = []
+    for pattern in spec.patterns:
+        if pattern.regex is None:
+            continue
+        # The ps_d group only exists for pathspec's own dir detection;
+        # rename it so the alternation compiles without group collisions.
+        part = pattern.regex.pattern.replace("(?P<ps_d>", "(?:")
+        ignore_parts.append(f"(?:{part})")
+
+    return _CompiledSpec(re.compile("|".join(ignore_parts)) if ignore_parts else None)
+
+
+class PathFilter:
+    def __init__(self, project_root: Path, *, resolved: bool = False) -> None:
+        # Callers that already resolved the root (scan_tree does it once per
+        # scan) can skip the extra stat-heavy resolve() here.
+        self.project_root = project_root if resolved else project_root.resolve()
+        self._spec = _load_spec(_gitignore_state(self.project_root))
 
-            if parent == root:
-                break
+    @staticmethod
+    def invalidate() -> None:
+        """Drop all cached specs; the mtime-keyed cache self-invalidates on
+        .gitignore edits, so this is only needed to bound memory."""
+        _load_spec.cache_clear()
 
-        return pathspec.PathSpec.from_lines("gitwildmatch", patterns)
+    def filter_batch(self, rel_texts: list[str]) -> list[bool]:
+        """Inclusion flags for root-relative POSIX paths."""
+        match_file = self._spec.match_file
+        return [not match_file(text) for text in rel_texts]
 
     def include(self, path: Path) -> bool:
         try:
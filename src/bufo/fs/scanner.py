@@ -1,14 +1,19 @@
-"""Concurrent filesystem scanning used by tree/path selectors."""
+"""Filesystem scanning used by tree/path selectors."""
 
 from __future__ import annotations
 
-import concurrent.futures
+import os
 import time
+from collections import deque
 from dataclasses import dataclass
 from pathlib import Path
 
 from bufo.fs.filtering import PathFilter
 
+# How many directories to list per filter batch; keeps the batched spec
+# match amortized without letting the pending queue grow unchecked.
+_BATCH_DIRS = 16
+
 
 @dataclass(slots=True)
 class ScanEntry:
@@ -20,34 +25,57 @@ def scan_tree(
     project_root: Path,
     *,
     max_duration_s: float = 4.0,
-    max_workers: int = 8,
 ) -> list[ScanEntry]:
+    # Directory enumeration is a cheap C-level syscall; a thread pool's
+    # future/queue overhead used to dominate it, so the walk is a plain
+    # bounded BFS on the calling thread (callers already run scan_tree via
+    # asyncio.to_thread when they need it off the event loop).
     project_root = project_root.resolve()
-    path_filter = PathFilter(project_root)
+    path_filter = PathFilter(project_root, resolved=True)
     started = time.monotonic()
     entries: list[ScanEntry] = []
 
-    def walk_dir(path: Path) -> list[Path]:
+    def walk_dir(path_text: str) -> list[tuple[str, bool, str]]:
+        # os.scandir surfaces dir-ness from the directory entry itself, so
+        # listing plus classification is one pass with no per-child stat.
         try:
-            return sorted(path.iterdir(), key=lambda item: (not item.is_dir(), item.name.lower()))
+            with os.scandir(path_text) as scan:
+                listed = [
+                    (entry.name, entry.is_dir(follow_symlinks=False), entry.path)
+                    for entry in scan
+                ]
         except OSError:
             return []
+        listed.sort(key=lambda item: (not item[1], item[0].casefold()))
+        return listed
+
+    root_text = str(project_root)
+    rel_start = len(root_text) + 1
+    native_sep = os.sep != "/"
+    pending: deque[str] = deque((root_text,))
+
+    while pending and (time.monotonic() - started) < max_duration_s:
+        children: list[tuple[str, bool, str]] = []
+        for _ in range(min(len(pending), _BATCH_DIRS)):
+            children.extend(walk_dir(pending.popleft()))
 
-    pending = [project_root]
-
-    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as pool:
-        while pending and (time.monotonic() - started) < max_duration_s:
-            chunk = pending[: max_workers * 2]
-            pending = pending[max_workers * 2 :]
-
-            futures = {pool.submit(walk_dir, path): path for path in chunk}
-            for future in concurrent.futures.as_completed(futures):
-                for child in future.result():
-                    if not path_filter.include(child):
-                        continue
-                    is_dir = child.is_dir()
-                    entries.append(ScanEntry(path=child, is_dir=is_dir))
-                    if is_dir:
-                        pending.append(child)
+        # One batched spec match for the whole chunk: amortizes pattern
+        # dispatch, and slicing the scandir path avoids relpath/resolve
+        # syscalls per child. Directories match with a trailing slash so
+        # dir-only ignore patterns (".git/") prune the subtree outright.
+        rel_texts = [
+            child_path[rel_start:] + "/" if is_dir else child_path[rel_start:]
+            for _, is_dir, child_path in children
+        ]
+        if native_sep:
+            rel_texts = [text.replace(os.sep, "/") for text in rel_texts]
+        for (name, is_dir, child_path), included in zip(
+            children, path_filter.filter_batch(rel_texts)
+        ):
+            if not included:
+                continue
+            entries.append(ScanEntry(path=Path(child_path), is_dir=is_dir))
+            if is_dir:
+                pending.append(child_path)
 
     return entries
@@ -2,87 +2,169 @@
 
 from __future__ import annotations
 
+import asyncio
 import threading
 import time
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Callable
 
-from watchdog.events import FileSystemEventHandler
+from watchdog.events import PatternMatchingEventHandler
 from watchdog.observers import Observer
 
 from bufo.runtime_logging import get_runtime_logger
 
+# Filtered inside watchdog's handler dispatch, before any debounce or
+# logging work runs for churn in trees we never want to react to.
+_IGNORE_PATTERNS = ["*/.git/*", "*/node_modules/*", "*/.venv/*"]
 
-class _DebouncedHandler(FileSystemEventHandler):
+# Emitted by some backends on every file open/close; they cannot mean a
+# content change, so they are dropped before any debounce work.
+_NOOP_EVENT_TYPES = frozenset({"opened", "closed", "closed_no_write"})
+
+
+@lru_cache(maxsize=256)
+def _resolved_key(raw: str) -> str:
+    # resolve() walks the whole path chain with lstat calls; the same roots
+    # come through watch/unwatch repeatedly. Cached on the raw string, same
+    # chdir caveat as paths._project_identity_cached.
+    return str(Path(raw).resolve())
+
+
+class _DebouncedHandler(PatternMatchingEventHandler):
     def __init__(
         self,
         callback: Callable[[], None],
         *,
         path: Path,
         debounce_s: float = 0.25,
+        loop: asyncio.AbstractEventLoop | None = None,
     ) -> None:
-        super().__init__()
+        super().__init__(ignore_patterns=_IGNORE_PATTERNS)
         self.callback = callback
         self.path = path
+        # Path.__str__ reformats the parts and allocates each call; the
+        # log sites want it per event, so render it once.
+        self._path_str = str(path)
         self.debounce_s = debounce_s
+        # Integer nanoseconds keep the per-event bookkeeping allocation-free
+        # under bursts; floats only appear at the call_later/Timer boundary.
+        self._debounce_ns = int(debounce_s * 1_000_000_000)
         self._lock = threading.Lock()
-        self._last_event_at = 0.0
+        self._last_event_at_ns = 0
         self._timer: threading.Timer | None = None
+        self._loop = loop
+        self._loop_handle: asyncio.TimerHandle | None = None
         self._logger = get_runtime_logger()
 
+    def set_loop(self, loop: asyncio.AbstractEventLoop | None) -> None:
+        self._loop = loop
+
     def on_any_event(self, event) -> None:  # type: ignore[override]
+        if getattr(event, "event_type", None) in _NOOP_EVENT_TYPES:
+            return
+        # With a loop attached, coalescing runs as call_later handles on the
+        # event loop — no timer threads at all. Without one (standalone use,
+        # shutdown races), fall back to a single self-rescheduling Timer.
+        loop = self._loop
+        if loop is not None:
+            try:
+                loop.call_soon_threadsafe(self._bump_on_loop)
+            except RuntimeError:
+                self._bump_on_thread()
+        else:
+            self._bump_on_thread()
+        # Guarded so the kwargs dict and path stringification don't run per
+        # raw event at the default warning level.
+        if self._logger.debug_enabled:
+            self._logger.debug(
+                "watch.event",
+                path=self._path_str,
+                event_type=getattr(event, "event_type", "unknown"),
+                is_directory=bool(getattr(event, "is_directory", False)),
+                src_path=str(getattr(event, "src_path", "")),
+            )
+
+    def _bump_on_loop(self) -> None:
+        self._last_event_at_ns = time.monotonic_ns()
+        if self._loop_handle is None and self._loop is not None:
+            self._loop_handle = self._loop.call_later(self.debounce_s, self._fire_on_loop)
+
+    def _fire_on_loop(self) -> None:
+        remaining_ns = self._debounce_ns - (time.monotonic_ns() - self._last_event_at_ns)
+        if remaining_ns > 0 and self._loop is not None:
+            self._loop_handle = self._loop.call_later(remaining_ns / 1e9, self._fire_on_loop)
+            return
+        self._loop_handle = None
+        self._invoke_callback()
+
+    def _bump_on_thread(self) -> None:
         with self._lock:
-            self._last_event_at = time.monotonic()
-            if self._timer is not None:
-                self._timer.cancel()
-            self._timer = threading.Timer(self.debounce_s, self._fire_if_stable)
-            self._timer.start()
-        self._logger.debug(
-            "watch.event",
-            path=str(self.path),
-            event_type=getattr(event, "event_type", "unknown"),
-            is_directory=bool(getattr(event, "is_directory", False)),
-            src_path=str(getattr(event, "src_path", "")),
-        )
+            self._last_event_at_ns = time.monotonic_ns()
+            # At most one timer thread per quiet period: bursts just bump
+            # the timestamp and the live timer reschedules itself until the
+            # tree settles, instead of spawning a thread per event.
+            if self._timer is None:
+                self._timer = threading.Timer(self.debounce_s, self._fire_if_stable)
+                self._timer.daemon = True
+                self._timer.start()
 
     def _fire_if_stable(self) -> None:
         with self._lock:
-            elapsed = time.monotonic() - self._last_event_at
-            if elapsed < self.debounce_s:
+            remaining_ns = self._debounce_ns - (time.monotonic_ns() - self._last_event_at_ns)
+            if remaining_ns > 0:
+                self._timer = threading.Timer(remaining_ns / 1e9, self._fire_if_stable)
+                self._timer.daemon = True
+                self._timer.start()
                 return
+            self._timer = None
+        self._invoke_callback()
+
+    def _invoke_callback(self) -> None:
         try:
             self.callback()
-            self._logger.debug("watch.callback.fired", path=str(self.path))
+            if self._logger.debug_enabled:
+                self._logger.debug("watch.callback.fired", path=self._path_str)
         except Exception as exc:
-            self._logger.error("watch.callback.failed", path=str(self.path), error=str(exc))
+            self._logger.error("watch.callback.failed", path=self._path_str, error=str(exc))
 
 
 class WatchManager:
-    def __init__(self) -> None:
+    def __init__(self, loop: asyncio.AbstractEventLoop | None = None) -> None:
         self._observer = Observer()
         self._observer.start()
-        self._handlers: dict[Path, _DebouncedHandler] = {}
-        self._callbacks: dict[Path, list[Callable[[], None]]] = {}
-        self._watches: dict[Path, Any] = {}
+        # Keyed by resolved path text: str hashing is cheaper than
+        # Path.__hash__ and the resolve itself is cached above.
+        self._handlers: dict[str, _DebouncedHandler] = {}
+        self._callbacks: dict[str, list[Callable[[], None]]] = {}
+        self._watches: dict[str, Any] = {}
+        self._loop = loop
         self._logger = get_runtime_logger()
         self._logger.info("watch.manager.started")
 
+    def set_loop(self, loop: asyncio.AbstractEventLoop | None) -> None:
+        """Attach the event loop debouncing should run on; callbacks then
+        fire on the loop instead of a timer thread."""
+        self._loop = loop
+        for handler in self._handlers.values():
+            handler.set_loop(loop)
+
     def watch(self, path: Path, callback: Callable[[], None]) -> bool:
-        key = path.resolve()
+        key = _resolved_key(str(path))
         callbacks = self._callbacks.setdefault(key, [])
         callbacks.append(callback)
         if key in self._handlers:
-            self._logger.debug("watch.manager.reused", path=str(key), callback_count=len(callbacks))
+            self._logger.debug("watch.manager.reused", path=key, callback_count=len(callbacks))
             return True
 
         def dispatch() -> None:
             for cb in list(self._callbacks.get(key, [])):
                 cb()
 
-        handler = _DebouncedHandler(dispatch, path=key)
+        handler = _DebouncedHandler(dispatch, path=Path(key), loop=self._loop)
         self._handlers[key] = handler
         try:
-            self._watches[key] = self._observer.schedule(handler, str(key), recursive=True)
+            self._watches[key] = self._observer.schedule(handler, key, recursive=True)
         except OSError as exc:
             # Gracefully degrade when inotify limits are exhausted.
             self._handlers.pop(key, None)
@@ -94,16 +176,16 @@ class WatchManager:
                 self._callbacks.pop(key, None)
             self._logger.warning(
                 "watch.manager.watch.failed",
-                path=str(key),
+                path=key,
                 errno=getattr(exc, "errno", None),
                 error=str(exc),
             )
             return False
-        self._logger.info("watch.manager.watch", path=str(key), callback_count=len(callbacks))
+        self._logger.info("watch.manager.watch", path=key, callback_count=len(callbacks))
         return True
 
     def unwatch(self, path: Path, callback: Callable[[], None] | None = None) -> None:
-        key = path.resolve()
+        key = _resolved_key(str(path))
         callbacks = self._callbacks.get(key)
         if callbacks is None:
             return
@@ -118,7 +200,7 @@ class WatchManager:
                 pass
 
         if callbacks:
-            self._logger.debug("watch.manager.unwatch.defer", path=str(key), callback_count=len(callbacks))
+            self._logger.debug("watch.manager.unwatch.defer", path=key, callback_count=len(callbacks))
             return
 
         self._callbacks.pop(key, None)
@@ -129,7 +211,7 @@ class WatchManager:
             except Exception:
                 pass
         self._handlers.pop(key, None)
-        self._logger.info("watch.manager.unwatch", path=str(key))
+        self._logger.info("watch.manager.unwatch", path=key)
 
     def close(self) -> None:
         self._observer.stop()
@@ -143,6 +225,9 @@ class WatchManager:
 class NullWatchManager:
     """No-op watcher for tests and restricted environments."""
 
+    def set_loop(self, loop: asyncio.AbstractEventLoop | None) -> None:  # noqa: ARG002
+        return
+
     def watch(self, path: Path, callback: Callable[[], None]) -> bool:  # noqa: ARG002
         return True
 
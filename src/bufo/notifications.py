@@ -22,22 +22,29 @@ class NotificationEvent:
 class Notifier:
     def __init__(self, settings: NotificationSettings) -> None:
         self.settings = settings
+        # Backend availability never changes at runtime; the settings flags
+        # are re-read per send so toggles from the settings screen apply.
+        self._backend_available = Notify is not None
+        # One reusable notifypy instance, created on first send: backend
+        # init is the expensive part and the object is reconfigurable.
+        self._note = None
 
     def send(self, event: NotificationEvent, *, app_focused: bool = True) -> None:
-        if self.settings.only_when_unfocused and app_focused:
+        if not self._backend_available:
             return
 
-        if not self.settings.desktop:
+        if self.settings.only_when_unfocused and app_focused:
             return
 
-        if Notify is None:
+        if not self.settings.desktop:
             return
 
-        note = Notify()
+        note = self._note
+        if note is None:
+            note = self._note = Notify()
         note.title = event.title
         note.message = event.body
-        with_sound = self.settings.sound
-        if with_sound:
+        if self.settings.sound:
             try:
                 note.audio = "default"
             except Exception:
@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from hashlib import sha1
+from functools import lru_cache
+from hashlib import blake2b
 from pathlib import Path
 
 from platformdirs import PlatformDirs
@@ -10,28 +11,49 @@ from platformdirs import PlatformDirs
 APP_NAME = "bufo"
 APP_AUTHOR = "bitnom"
 
+_DIRS: PlatformDirs | None = None
+
+# Directories this process has already created; lets ensure_dir skip the
+# mkdir syscall on every repeat access (logger and stores hit these roots
+# constantly).
+_CREATED_DIRS: set[str] = set()
+
 
 def dirs() -> PlatformDirs:
-    return PlatformDirs(appname=APP_NAME, appauthor=APP_AUTHOR, roaming=False)
+    global _DIRS
+    if _DIRS is None:
+        _DIRS = PlatformDirs(appname=APP_NAME, appauthor=APP_AUTHOR, roaming=False)
+    return _DIRS
 
 
 def ensure_dir(path: Path) -> Path:
-    path.mkdir(parents=True, exist_ok=True)
+    key = str(path)
+    if key not in _CREATED_DIRS:
+        path.mkdir(parents=True, exist_ok=True)
+        _CREATED_DIRS.add(key)
     return path
 
 
+@lru_cache(maxsize=1)
 def config_root() -> Path:
     return ensure_dir(Path(dirs().user_config_path))
 
 
+@lru_cache(maxsize=1)
 def state_root() -> Path:
     return ensure_dir(Path(dirs().user_state_path))
 
 
+@lru_cache(maxsize=1)
 def data_root() -> Path:
     return ensure_dir(Path(dirs().user_data_path))
 
 
+@lru_cache(maxsize=1)
+def cache_root() -> Path:
+    return ensure_dir(Path(dirs().user_cache_path))
+
+
 def settings_path() -> Path:
     return config_root() / "settings.json"
 
@@ -44,12 +66,23 @@ def session_db_path() -> Path:
     return state_root() / "sessions.sqlite3"
 
 
-def project_identity(project_root: Path) -> str:
-    normalized = str(project_root.expanduser().resolve())
-    digest = sha1(normalized.encode("utf-8"), usedforsecurity=False).hexdigest()[:12]
-    leaf = project_root.name or "root"
+@lru_cache(maxsize=256)
+def _project_identity_cached(raw: str) -> str:
+    path = Path(raw)
+    normalized = str(path.expanduser().resolve())
+    # Non-cryptographic fingerprint; blake2b beats sha1 on short inputs and
+    # digest_size=6 gives the 12 hex chars directly instead of truncating.
+    digest = blake2b(normalized.encode("utf-8"), digest_size=6).hexdigest()
+    leaf = path.name or "root"
     return f"{leaf}-{digest}"
 
 
+def project_identity(project_root: Path) -> str:
+    # Cached on the raw string: resolve() stats the whole path chain, and
+    # the same roots come through here repeatedly. Call
+    # _project_identity_cached.cache_clear() if the process ever chdirs.
+    return _project_identity_cached(str(project_root))
+
+
 def project_data_dir(project_root: Path) -> Path:
     return ensure_dir(data_root() / "projects" / project_identity(project_root))
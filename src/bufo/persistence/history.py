@@ -2,13 +2,27 @@
 
 from __future__ import annotations
 
+import atexit
 import json
+import os
+import threading
+from collections import deque
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from pathlib import Path
+from typing import BinaryIO
 
 from bufo.paths import project_data_dir
 
+try:
+    import orjson
+except Exception:  # pragma: no cover - optional runtime fallback
+    orjson = None
+
+# Generous per-record estimate used to size the tail window; history lines
+# are a short value plus a timestamp.
+_AVG_LINE_BYTES = 128
+
 
 def _ts() -> str:
     return datetime.now(UTC).isoformat()
@@ -24,36 +38,89 @@ class JsonlHistory:
     def __init__(self, path: Path) -> None:
         self.path = path
         self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Last read() result, kept current by append(); repeat reads with
+        # the same limit skip the file entirely.
+        self._cache: deque[HistoryItem] | None = None
+        self._cache_limit = 0
+        # Persistent append handle, opened lazily; append() is called per
+        # committed prompt and should not pay open/close each time.
+        self._lock = threading.Lock()
+        self._handle: BinaryIO | None = None
 
     def append(self, value: str) -> None:
         record = {"value": value, "created_at": _ts()}
-        with self.path.open("a", encoding="utf-8") as f:
-            f.write(json.dumps(record, ensure_ascii=True) + "\n")
+        if orjson is not None:
+            line = orjson.dumps(record)
+        else:
+            line = json.dumps(record, ensure_ascii=True).encode("utf-8")
+        with self._lock:
+            handle = self._handle
+            if handle is None:
+                handle = self._handle = self.path.open("ab")
+                atexit.register(self.close)
+            handle.write(line + b"\n")
+            handle.flush()
+        if self._cache is not None:
+            self._cache.append(HistoryItem(value=record["value"], created_at=record["created_at"]))
+
+    def close(self) -> None:
+        with self._lock:
+            if self._handle is not None:
+                try:
+                    self._handle.close()
+                except OSError:  # pragma: no cover - sink already gone
+                    pass
+                self._handle = None
 
     def read(self, limit: int = 200) -> list[HistoryItem]:
-        if not self.path.exists():
+        if self._cache is not None and self._cache_limit == limit:
+            return list(self._cache)
+
+        items = self._read_tail(limit)
+        self._cache = deque(items, maxlen=max(limit, 1))
+        self._cache_limit = limit
+        return items
+
+    def _read_tail(self, limit: int) -> list[HistoryItem]:
+        """Parse only the last ~limit records by seeking near EOF; a full
+        scan happens only when the tail window comes up short."""
+        try:
+            size = os.stat(self.path).st_size
+        except OSError:
             return []
 
+        window = limit * _AVG_LINE_BYTES * 2
+        with self.path.open("rb") as f:
+            seeked = size > window
+            if seeked:
+                f.seek(size - window)
+                f.readline()  # discard the partial line the seek landed in
+            raw_lines = f.read().splitlines()
+
+        items = self._parse_lines(raw_lines[-limit:] if limit >= 0 else raw_lines)
+        if seeked and len(items) < limit:
+            # Unusually long lines shrank the window below limit records.
+            with self.path.open("rb") as f:
+                items = self._parse_lines(f.read().splitlines()[-limit:])
+        return items
+
+    @staticmethod
+    def _parse_lines(raw_lines: list[bytes]) -> list[HistoryItem]:
         items: list[HistoryItem] = []
-        with self.path.open("r", encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    payload = json.loads(line)
-                except json.JSONDecodeError:
-                    continue
-                items.append(
-                    HistoryItem(
-                        value=str(payload.get("value", "")),
-                        created_at=str(payload.get("created_at", "")),
-                    )
+        for raw in raw_lines:
+            if not raw.strip():
+                continue
+            try:
+                payload = orjson.loads(raw) if orjson is not None else json.loads(raw)
+            except ValueError:
+                continue
+            items.append(
+                HistoryItem(
+                    value=str(payload.get("value", "")),
+                    created_at=str(payload.get("created_at", "")),
                 )
-
-        if len(items) <= limit:
-            return items
-        return items[-limit:]
+            )
+        return items
 
 
 class ProjectHistories:
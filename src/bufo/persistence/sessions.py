@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import json
 import sqlite3
+import threading
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from pathlib import Path
@@ -11,6 +12,11 @@ from typing import Any
 
 from bufo.paths import session_db_path
 
+try:
+    import orjson
+except Exception:  # pragma: no cover - optional runtime fallback
+    orjson = None
+
 
 def _utc_now() -> str:
     return datetime.now(UTC).isoformat()
@@ -33,15 +39,26 @@ class SessionStore:
     def __init__(self, db_path: Path | None = None) -> None:
         self.db_path = db_path or session_db_path()
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        # One persistent connection: opening sqlite per statement dominated
+        # sub-millisecond queries. The lock serializes access since recent()
+        # runs off-loop in a worker thread.
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA temp_store=MEMORY")
+        # Parsed metadata keyed by session id; recent() is polled and keeps
+        # returning the same rows, so identical JSON is parsed once.
+        self._metadata_cache: dict[int, tuple[str, dict[str, Any]]] = {}
         self.ensure_schema()
 
-    def _connect(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        return conn
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
 
     def ensure_schema(self) -> None:
-        with self._connect() as conn:
+        with self._lock, self._conn as conn:
             conn.execute(
                 """
                 CREATE TABLE IF NOT EXISTS sessions (
@@ -84,32 +101,42 @@ class SessionStore:
         now = _utc_now()
         metadata_json = json.dumps(metadata, sort_keys=True)
 
-        with self._connect() as conn:
+        params = (
+            agent_name,
+            agent_identity,
+            agent_session_id,
+            title,
+            protocol,
+            now,
+            now,
+            metadata_json,
+        )
+
+        with self._lock, self._conn as conn:
             if agent_session_id:
+                # Single round-trip upsert against the partial unique index;
+                # created_at keeps its original value on the update path.
                 row = conn.execute(
                     """
-                    SELECT id FROM sessions
-                    WHERE agent_identity = ? AND agent_session_id = ?
+                    INSERT INTO sessions (
+                        agent_name, agent_identity, agent_session_id,
+                        title, protocol, created_at, last_used_at, metadata_json
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(agent_identity, agent_session_id)
+                    WHERE agent_session_id IS NOT NULL
+                    DO UPDATE SET
+                        agent_name = excluded.agent_name,
+                        title = excluded.title,
+                        protocol = excluded.protocol,
+                        last_used_at = excluded.last_used_at,
+                        metadata_json = excluded.metadata_json
+                    RETURNING id
                     """,
-                    (agent_identity, agent_session_id),
+                    params,
                 ).fetchone()
-            else:
-                row = None
-
-            if row:
-                session_id = int(row["id"])
-                conn.execute(
-                    """
-                    UPDATE sessions
-                    SET agent_name = ?, title = ?, protocol = ?,
-                        last_used_at = ?, metadata_json = ?
-                    WHERE id = ?
-                    """,
-                    (agent_name, title, protocol, now, metadata_json, session_id),
-                )
-                return session_id
+                return int(row["id"])
 
-            created_at = now
+            # NULL session ids never conflict; a plain INSERT is enough.
             cursor = conn.execute(
                 """
                 INSERT INTO sessions (
@@ -117,31 +144,22 @@ class SessionStore:
                     title, protocol, created_at, last_used_at, metadata_json
                 ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
                 """,
-                (
-                    agent_name,
-                    agent_identity,
-                    agent_session_id,
-                    title,
-                    protocol,
-                    created_at,
-                    now,
-                    metadata_json,
-                ),
+                params,
             )
             return int(cursor.lastrowid)
 
     def get(self, session_id: int) -> SessionRecord | None:
-        with self._connect() as conn:
-            row = conn.execute(
+        with self._lock:
+            row = self._conn.execute(
                 "SELECT * FROM sessions WHERE id = ?",
                 (session_id,),
             ).fetchone()
 
-        return _row_to_record(row) if row else None
+        return self._row_to_record(row) if row else None
 
     def get_by_agent_pair(self, agent_identity: str, agent_session_id: str) -> SessionRecord | None:
-        with self._connect() as conn:
-            row = conn.execute(
+        with self._lock:
+            row = self._conn.execute(
                 """
                 SELECT * FROM sessions
                 WHERE agent_identity = ? AND agent_session_id = ?
@@ -149,27 +167,35 @@ class SessionStore:
                 (agent_identity, agent_session_id),
             ).fetchone()
 
-        return _row_to_record(row) if row else None
+        return self._row_to_record(row) if row else None
 
     def recent(self, limit: int = 20) -> list[SessionRecord]:
-        with self._connect() as conn:
-            rows = conn.execute(
+        with self._lock:
+            rows = self._conn.execute(
                 "SELECT * FROM sessions ORDER BY last_used_at DESC LIMIT ?",
                 (limit,),
             ).fetchall()
 
-        return [_row_to_record(row) for row in rows]
-
-
-def _row_to_record(row: sqlite3.Row) -> SessionRecord:
-    return SessionRecord(
-        id=int(row["id"]),
-        agent_name=str(row["agent_name"]),
-        agent_identity=str(row["agent_identity"]),
-        agent_session_id=row["agent_session_id"],
-        title=str(row["title"]),
-        protocol=str(row["protocol"]),
-        created_at=str(row["created_at"]),
-        last_used_at=str(row["last_used_at"]),
-        metadata=json.loads(str(row["metadata_json"])),
-    )
+        return [self._row_to_record(row) for row in rows]
+
+    def _parse_metadata(self, session_id: int, raw: str) -> dict[str, Any]:
+        cached = self._metadata_cache.get(session_id)
+        if cached is not None and cached[0] == raw:
+            return cached[1]
+        parsed = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        self._metadata_cache[session_id] = (raw, parsed)
+        return parsed
+
+    def _row_to_record(self, row: sqlite3.Row) -> SessionRecord:
+        session_id = int(row["id"])
+        return SessionRecord(
+            id=session_id,
+            agent_name=str(row["agent_name"]),
+            agent_identity=str(row["agent_identity"]),
+            agent_session_id=row["agent_session_id"],
+            title=str(row["title"]),
+            protocol=str(row["protocol"]),
+            created_at=str(row["created_at"]),
+            last_used_at=str(row["last_used_at"]),
+            metadata=self._parse_metadata(session_id, str(row["metadata_json"])),
+        )
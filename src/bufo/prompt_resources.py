@@ -4,29 +4,76 @@ from __future__ import annotations
 
 import base64
 import mimetypes
+import os
 import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 _PATTERN = re.compile(r"(?<!\S)@(?P<path>[\w./-]+)")
 
+# Files above this size are referenced, not embedded: inlining reads the
+# whole file and (for binary) base64 triples it again, so the cap is what
+# bounds peak memory per prompt.
+EMBED_MAX_BYTES = 4 * 1024 * 1024
+
+
+@lru_cache(maxsize=256)
+def _guess_mime(path_text: str) -> str:
+    return mimetypes.guess_type(path_text)[0] or "application/octet-stream"
+
 
 def expand_prompt_resources(project_root: Path, prompt: str) -> tuple[str, list[dict[str, Any]]]:
+    # Most prompts reference no files; skip the regex scan entirely then.
+    if "@" not in prompt:
+        return prompt, []
+
     resources: list[dict[str, Any]] = []
+    # Resolved once here rather than per match inside repl — resolve()
+    # stats the whole path chain.
+    root_prefix = str(project_root.resolve()) + os.sep
+    # Replacement text per rel_path already handled this call: repeat
+    # references skip the resolve/stat/read entirely and the file is
+    # embedded once, not once per mention.
+    seen: dict[str, str] = {}
 
     def repl(match: re.Match[str]) -> str:
         rel_path = match.group("path")
+        cached = seen.get(rel_path)
+        if cached is not None:
+            return cached
+        replacement = seen[rel_path] = _expand(match, rel_path)
+        return replacement
+
+    def _expand(match: re.Match[str], rel_path: str) -> str:
         path = (project_root / rel_path).resolve()
 
-        try:
-            path.relative_to(project_root.resolve())
-        except ValueError:
+        # Prefix comparison instead of relative_to(): same containment
+        # check without the raise/catch round trip per escape attempt.
+        if not str(path).startswith(root_prefix):
             return match.group(0)
 
-        if not path.exists() or not path.is_file():
+        try:
+            stat = path.stat()
+        except OSError:
+            return match.group(0)
+        if not path.is_file():
             return match.group(0)
 
-        mime = mimetypes.guess_type(str(path))[0] or "application/octet-stream"
+        mime = _guess_mime(str(path))
+        if stat.st_size > EMBED_MAX_BYTES:
+            # Too large to inline; hand the agent a descriptor it can
+            # choose to read itself.
+            resources.append(
+                {
+                    "type": "reference",
+                    "path": rel_path,
+                    "mime": mime,
+                    "size": stat.st_size,
+                }
+            )
+            return rel_path
+
         data = path.read_bytes()
         if mime.startswith("text/"):
             resources.append(
@@ -3,11 +3,28 @@
 from __future__ import annotations
 
 import asyncio
+import itertools
 import json
 from contextlib import AbstractAsyncContextManager
 from dataclasses import dataclass
 from typing import Any, Awaitable, Callable
 
+try:
+    import orjson
+except Exception:  # pragma: no cover - optional runtime fallback
+    orjson = None
+
+if orjson is not None:
+    def _dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode("utf-8")
+
+    _loads = orjson.loads
+else:  # pragma: no cover - exercised only without orjson installed
+    def _dumps(obj: Any) -> str:
+        return json.dumps(obj, separators=(",", ":"))
+
+    _loads = json.loads
+
 JsonDict = dict[str, Any]
 MethodHandler = Callable[[dict[str, Any] | list[Any] | None], Awaitable[Any]]
 Sender = Callable[[str], Awaitable[None]]
@@ -26,9 +43,14 @@ class JsonRpcFailure(Exception):
 class JsonRpcConnection:
     def __init__(self, sender: Sender) -> None:
         self._sender = sender
-        self._next_id = 1
+        # Small monotonic ints keep the envelope compact on the wire and make
+        # the pending-futures dict hash by identity-fast integers.
+        self._next_id = itertools.count(1).__next__
         self._pending: dict[int, asyncio.Future[Any]] = {}
         self._methods: dict[str, MethodHandler] = {}
+        self._outbox: list[tuple[int, str]] = []
+        self._flush_task: asyncio.Task[None] | None = None
+        self._frame_prefixes: dict[str, str] = {}
 
     def register_method(self, name: str, handler: MethodHandler) -> None:
         self._methods[name] = handler
@@ -40,26 +62,55 @@ class JsonRpcConnection:
         *,
         timeout: float | None = None,
     ) -> Any:
-        request_id = self._next_id
-        self._next_id += 1
+        request_id = self._next_id()
 
-        payload: JsonDict = {
-            "jsonrpc": "2.0",
-            "id": request_id,
-            "method": method,
-        }
-        if params is not None:
-            payload["params"] = params
-
-        fut: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+        loop = asyncio.get_running_loop()
+        fut: asyncio.Future[Any] = loop.create_future()
         self._pending[request_id] = fut
 
-        await self._sender(json.dumps(payload, separators=(",", ":")))
+        # Calls issued within the same event-loop tick coalesce into one
+        # JSON-RPC batch frame; the flush task drains the outbox on the next
+        # iteration, so bursty callers pay a single write instead of N.
+        self._outbox.append((request_id, self._encode_frame(request_id, method, params)))
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = loop.create_task(self._flush_outbox())
 
         if timeout is None:
             return await fut
         return await asyncio.wait_for(fut, timeout=timeout)
 
+    def _encode_frame(
+        self,
+        request_id: int,
+        method: str,
+        params: dict[str, Any] | list[Any] | None,
+    ) -> str:
+        # The envelope is partially evaluated per method: everything except
+        # the id and params is serialized once and cached, skipping the dict
+        # construction and encoder dispatch that json.dumps would repeat.
+        prefix = self._frame_prefixes.get(method)
+        if prefix is None:
+            prefix = f'{{"jsonrpc":"2.0","method":{_dumps(method)},"id":'
+            self._frame_prefixes[method] = prefix
+        if params is None:
+            return f"{prefix}{request_id}}}"
+        return f'{prefix}{request_id},"params":{_dumps(params)}}}'
+
+    async def _flush_outbox(self) -> None:
+        while self._outbox:
+            frames, self._outbox = self._outbox, []
+            if len(frames) == 1:
+                text = frames[0][1]
+            else:
+                text = "[" + ",".join(frame for _, frame in frames) + "]"
+            try:
+                await self._sender(text)
+            except Exception as exc:
+                for request_id, _ in frames:
+                    fut = self._pending.pop(request_id, None)
+                    if fut is not None and not fut.done():
+                        fut.set_exception(exc)
+
     async def notify(
         self,
         method: str,
@@ -68,17 +119,28 @@ class JsonRpcConnection:
         payload: JsonDict = {"jsonrpc": "2.0", "method": method}
         if params is not None:
             payload["params"] = params
-        await self._sender(json.dumps(payload, separators=(",", ":")))
+        await self._sender(_dumps(payload))
 
-    async def feed(self, raw_line: str) -> None:
+    async def feed(self, raw_line: bytes | str) -> None:
+        # bytes frames go straight to the parser, which decodes UTF-8
+        # internally; callers need not pay a separate str conversion.
         if not raw_line.strip():
             return
 
         try:
-            message = json.loads(raw_line)
-        except json.JSONDecodeError:
+            message = _loads(raw_line)
+        except ValueError:  # malformed JSON or invalid UTF-8 in a bytes frame
             return
 
+        if isinstance(message, list):
+            for item in message:
+                if isinstance(item, dict):
+                    await self._dispatch(item)
+            return
+        if isinstance(message, dict):
+            await self._dispatch(message)
+
+    async def _dispatch(self, message: JsonDict) -> None:
         if "method" in message:
             await self._handle_request(message)
             return
@@ -109,14 +171,7 @@ class JsonRpcConnection:
 
         if request_id is not None:
             await self._sender(
-                json.dumps(
-                    {
-                        "jsonrpc": "2.0",
-                        "id": request_id,
-                        "result": result,
-                    },
-                    separators=(",", ":"),
-                )
+                _dumps({"jsonrpc": "2.0", "id": request_id, "result": result})
             )
 
     def _handle_response(self, message: JsonDict) -> None:
@@ -150,9 +205,12 @@ class JsonRpcConnection:
         if data is not None:
             payload["error"]["data"] = data
 
-        await self._sender(json.dumps(payload, separators=(",", ":")))
+        await self._sender(_dumps(payload))
 
     def shutdown(self) -> None:
+        self._outbox.clear()
+        if self._flush_task is not None and not self._flush_task.done():
+            self._flush_task.cancel()
         for fut in self._pending.values():
             if not fut.done():
                 fut.cancel()
@@ -169,7 +227,7 @@ class OutboundCall:
 
 
 class RequestBatch(AbstractAsyncContextManager["RequestBatch"]):
-    """Collect one or more outbound calls and send them in sequence on exit."""
+    """Collect one or more outbound calls and ship them together on exit."""
 
     def __init__(self, connection: JsonRpcConnection) -> None:
         self.connection = connection
@@ -183,8 +241,17 @@ class RequestBatch(AbstractAsyncContextManager["RequestBatch"]):
     async def __aexit__(self, exc_type, exc, tb) -> bool | None:  # type: ignore[override]
         if exc is not None:
             return None
-        for call in self.calls:
-            self.results.append(await self.connection.call(call.method, call.params))
+        if not self.calls:
+            return None
+        # Issuing every call before awaiting any response lands them all in
+        # the connection outbox within one loop tick, so they leave as a
+        # single JSON-RPC batch array and resolve concurrently; total
+        # latency is the slowest call, not the sum.
+        self.results = list(
+            await asyncio.gather(
+                *(self.connection.call(call.method, call.params) for call in self.calls)
+            )
+        )
         return None
 
 
@@ -9,6 +9,7 @@ from textual import events
 from textual.app import ComposeResult
 from textual.containers import Horizontal, Vertical
 from textual.screen import Screen
+from textual.timer import Timer
 from textual.widgets import Button, Footer, Header, Static
 
 from bufo.agents.schema import AgentDescriptor
@@ -65,10 +66,6 @@ class MainScreen(Screen):
         width: 1fr;
         padding: 0 1;
     }
-
-    .hidden {
-        display: none;
-    }
     """
 
     def __init__(
@@ -90,6 +87,12 @@ class MainScreen(Screen):
         self.watch_manager = watch_manager
         self.bridge_factory = bridge_factory
         self._sidebar_hidden = settings.sidebar.mode == "hidden"
+        # Mounted tab buttons by mode_name plus the last rendered snapshot;
+        # rebuilds diff against these instead of remounting the strip.
+        self._tab_buttons: dict[str, Button] = {}
+        self._tabs_snapshot: tuple[Any, ...] | None = None
+        self._tab_refresh_timer: Timer | None = None
+        self._sidebar: Vertical | None = None
         self.logger = get_runtime_logger()
         super().__init__()
 
@@ -101,7 +104,7 @@ class MainScreen(Screen):
             yield Button("+ New Session", id="new-session", variant="success")
             yield Button("Sessions", id="manage-sessions")
         with Horizontal(id="main-body"):
-            with Vertical(id="sidebar", classes="hidden" if self._sidebar_hidden else ""):
+            with Vertical(id="sidebar"):
                 yield Static(f"[b]Plan[/b]\n- Start task\n- Run agent\n- Apply changes", markup=True)
                 yield ProjectTreePanel(self.project_root, self.watch_manager)
             with Vertical(id="conversation-pane"):
@@ -118,6 +121,12 @@ class MainScreen(Screen):
         yield Footer()
 
     def on_mount(self) -> None:
+        # The reference is cached so toggles skip a DOM query, and hiding
+        # goes through styles.display: the panel stays mounted either way,
+        # so showing it again never re-runs compose for the project tree.
+        self._sidebar = self.query_one("#sidebar", Vertical)
+        if self._sidebar_hidden:
+            self._sidebar.styles.display = "none"
         self._refresh_session_tabs()
 
     def on_screen_resume(self, _event: events.ScreenResume) -> None:
@@ -145,13 +154,21 @@ class MainScreen(Screen):
             self.post_message(OpenSessions())
 
     def action_toggle_sidebar(self) -> None:
-        sidebar = self.query_one("#sidebar", Vertical)
-        if "hidden" in sidebar.classes:
-            sidebar.remove_class("hidden")
-        else:
-            sidebar.add_class("hidden")
+        if self._sidebar is None:
+            return
+        self._sidebar_hidden = not self._sidebar_hidden
+        self._sidebar.styles.display = "none" if self._sidebar_hidden else "block"
 
     def _refresh_session_tabs(self) -> None:
+        # Short deferral so bursts of resume/update events collapse into one
+        # rebuild; the exclusive worker group below is the second line of
+        # defense against overlap.
+        if self._tab_refresh_timer is not None:
+            self._tab_refresh_timer.stop()
+        self._tab_refresh_timer = self.set_timer(0.05, self._launch_tab_rebuild)
+
+    def _launch_tab_rebuild(self) -> None:
+        self._tab_refresh_timer = None
         self.run_worker(
             self._rebuild_session_tabs,
             group=f"session-tabs-{self.session.mode_name}",
@@ -161,21 +178,65 @@ class MainScreen(Screen):
 
     async def _rebuild_session_tabs(self) -> None:
         container = self.query_one("#session-tabs", Horizontal)
-        await container.remove_children()
-
         sessions = list(self.app.session_tracker.all())
+        current_mode = self.app.current_mode
+
+        snapshot = (
+            tuple((session.mode_name, session.title, session.state) for session in sessions),
+            current_mode,
+        )
+        if snapshot == self._tabs_snapshot:
+            return
+
         if not sessions:
-            await container.mount(Static("No sessions yet", id="no-session-tabs"))
+            if self._tab_buttons:
+                with self.app.batch_update():
+                    await container.remove_children()
+                    self._tab_buttons.clear()
+                    await container.mount(Static("No sessions yet", id="no-session-tabs"))
+            self._tabs_snapshot = snapshot
             return
 
-        for session in sessions:
-            label = f"{session.title} ({session.state})"
-            is_active = session.mode_name == self.app.current_mode
-            await container.mount(
-                Button(
-                    label,
-                    id=f"session-tab-{session.mode_name}",
-                    classes="session-tab",
-                    variant="primary" if is_active else "default",
-                )
-            )
+        # Diff against what is already mounted: drop stale buttons, mount
+        # only new ones, and flip label/variant in place on the rest.
+        # Sessions only ever append (removals keep relative order), so
+        # mounting new buttons at the end preserves index order. The whole
+        # mutation runs inside batch_update so the compositor repaints the
+        # strip once, and new buttons go in via one mount_all.
+        with self.app.batch_update():
+            placeholder = container.query("#no-session-tabs")
+            if placeholder:
+                await placeholder.remove()
+
+            wanted = {session.mode_name for session in sessions}
+            for mode_name in list(self._tab_buttons):
+                if mode_name not in wanted:
+                    await self._tab_buttons.pop(mode_name).remove()
+
+            new_buttons: list[Button] = []
+            for session in sessions:
+                label = f"{session.title} ({session.state})"
+                variant = "primary" if session.mode_name == current_mode else "default"
+                button = self._tab_buttons.get(session.mode_name)
+                if button is None:
+                    button = Button(
+                        label,
+                        id=f"session-tab-{session.mode_name}",
+                        classes="session-tab",
+                        variant=variant,
+                    )
+                    self._tab_buttons[session.mode_name] = button
+                    new_buttons.append(button)
+                    continue
+                if str(button.label) != label:
+                    button.label = label
+                if button.variant != variant:
+                    button.variant = variant
+
+            if new_buttons:
+                await container.mount_all(new_buttons)
+
+        # Recorded only on completion: the exclusive worker can cancel an
+        # in-flight rebuild at any await, and a half-applied diff must not
+        # count as rendered or its replacement run would skip the work.
+        self._tabs_snapshot = snapshot
@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+from rich.text import Text
 from textual.app import ComposeResult
 from textual.containers import Vertical
 from textual.screen import ModalScreen
-from textual.widgets import Button, ListItem, ListView, Static
+from textual.widgets import Button, OptionList, Static
+from textual.widgets.option_list import Option
 
 from bufo.sessions.tracker import SessionMeta
 
@@ -25,7 +27,7 @@ class SessionsScreen(ModalScreen[str | None]):
         padding: 1;
     }
 
-    SessionsScreen ListView {
+    SessionsScreen OptionList {
         height: 1fr;
         min-height: 8;
     }
@@ -38,16 +40,23 @@ class SessionsScreen(ModalScreen[str | None]):
     def compose(self) -> ComposeResult:
         with Vertical():
             yield Static("[b]Sessions[/b]", markup=True)
-            items = [
-                ListItem(Static(f"{session.title} [{session.state}] ({session.mode_name})", markup=False), id=session.mode_name)
+            # OptionList renders rows on demand, so a long session history
+            # costs one lightweight Option per entry instead of a mounted
+            # ListItem+Static widget pair each.
+            # Text prompts keep the bracketed state literal instead of being
+            # parsed as markup (the ListItem version used markup=False).
+            options = [
+                Option(
+                    Text(f"{session.title} [{session.state}] ({session.mode_name})"),
+                    id=session.mode_name,
+                )
                 for session in self.sessions
             ]
-            yield ListView(*items, id="session-list")
+            yield OptionList(*options, id="session-list")
             yield Button("Close", id="close", variant="primary")
 
-    def on_list_view_selected(self, event: ListView.Selected) -> None:
-        item_id = event.item.id if event.item else None
-        self.dismiss(item_id)
+    def on_option_list_option_selected(self, event: OptionList.OptionSelected) -> None:
+        self.dismiss(event.option.id)
 
     def on_button_pressed(self, _event: Button.Pressed) -> None:
         self.dismiss(None)
@@ -5,6 +5,7 @@ from __future__ import annotations
 from textual.app import ComposeResult
 from textual.containers import Vertical
 from textual.screen import ModalScreen
+from textual.timer import Timer
 from textual.widgets import Button, DataTable, Input, Static
 
 from bufo.config.models import AppSettings
@@ -32,6 +33,13 @@ class SettingsScreen(ModalScreen[AppSettings | None]):
     def __init__(self, settings: AppSettings) -> None:
         self.settings = settings
         self.filtered: list[tuple[str, str]] = settings.setting_items()
+        # Lower-cased match blobs built once; filtering per keystroke is
+        # then a substring check per row, not a format+lower per row.
+        self._filter_index: list[tuple[str, str, str]] = [
+            (key, value, f"{key} {value}".lower()) for key, value in self.filtered
+        ]
+        self._filter_timer: Timer | None = None
+        self._pending_query = ""
         super().__init__()
 
     def compose(self) -> ComposeResult:
@@ -49,14 +57,22 @@ class SettingsScreen(ModalScreen[AppSettings | None]):
     def on_input_changed(self, event: Input.Changed) -> None:
         if event.input.id != "filter":
             return
-        self._render_rows(event.value)
+        # Debounced so fast typing rebuilds the table once per quiet
+        # window rather than per keystroke.
+        self._pending_query = event.value
+        if self._filter_timer is not None:
+            self._filter_timer.stop()
+        self._filter_timer = self.set_timer(0.08, self._apply_pending_filter)
+
+    def _apply_pending_filter(self) -> None:
+        self._filter_timer = None
+        self._render_rows(self._pending_query)
 
     def _render_rows(self, query: str) -> None:
         q = query.strip().lower()
         table = self.query_one(DataTable)
         table.clear(columns=False)
-        for key, value in self.filtered:
-            blob = f"{key} {value}".lower()
+        for key, value, blob in self._filter_index:
             if q and q not in blob:
                 continue
             table.add_row(key, value)
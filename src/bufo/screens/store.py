@@ -56,8 +56,23 @@ class StoreScreen(Screen):
         self.agents = agents
         self.recent_sessions = recent_sessions
         self.project_root = project_root
+        # Snapshot of what the recent list currently renders; polled
+        # refreshes with unchanged data skip the rebuild entirely.
+        self._recent_keys: tuple[tuple[int, str, str, str, str], ...] | None = None
+        # Display strings keyed by (id, last_used_at) so a session's label
+        # is formatted once until it is actually touched again.
+        self._recent_labels: dict[tuple[int, str], str] = {}
         super().__init__(id=id)
 
+    def _recent_label(self, session: SessionRecord) -> str:
+        key = (session.id, session.last_used_at)
+        label = self._recent_labels.get(key)
+        if label is None:
+            label = self._recent_labels[key] = (
+                f"{session.agent_name} | {session.title} | {session.last_used_at}"
+            )
+        return label
+
     def compose(self) -> ComposeResult:
         yield Static("[b]Bufo Agent Store[/b]", markup=True)
         yield Input(value=str(self.project_root), id="project-root", placeholder="Project directory")
@@ -75,12 +90,7 @@ class StoreScreen(Screen):
             with Vertical(id="right"):
                 yield Static("Recent Sessions")
                 recent_items = [
-                    ListItem(
-                        Static(
-                            f"{session.agent_name} | {session.title} | {session.last_used_at}",
-                            markup=False,
-                        ),
-                    )
+                    ListItem(Static(self._recent_label(session), markup=False))
                     for session in self.recent_sessions
                 ]
                 yield ListView(*recent_items, id="recent-list")
@@ -147,18 +157,40 @@ class StoreScreen(Screen):
             )
         )
 
-    def refresh_recent_sessions(self, sessions: list[SessionRecord]) -> None:
-        self.recent_sessions = sessions
-        recent = self.query_one("#recent-list", ListView)
-        recent.clear()
-        recent.extend(
+    def refresh_catalog(self, agents: list[AgentDescriptor]) -> None:
+        self.agents = agents
+        agent_list = self.query_one("#agent-list", ListView)
+        agent_list.clear()
+        agent_list.extend(
             [
-                ListItem(
-                    Static(
-                        f"{session.agent_name} | {session.title} | {session.last_used_at}",
-                        markup=False,
-                    ),
-                )
-                for session in sessions
+                ListItem(Static(f"{agent.name} - {agent.description}"), id=agent.identity)
+                for agent in agents
             ]
         )
+
+    def refresh_recent_sessions(self, sessions: list[SessionRecord]) -> None:
+        keys = tuple(
+            (session.id, session.agent_name, session.title, session.last_used_at, session.agent_identity)
+            for session in sessions
+        )
+        if keys == self._recent_keys:
+            self.recent_sessions = sessions
+            return
+        self._recent_keys = keys
+
+        self.recent_sessions = sessions
+        recent = self.query_one("#recent-list", ListView)
+        # The list is sorted by last_used_at, so any real change reorders
+        # most rows anyway; rebuild in one batched compositor update rather
+        # than diffing items that would move regardless.
+        with self.app.batch_update():
+            recent.clear()
+            recent.extend(
+                [
+                    ListItem(Static(self._recent_label(session), markup=False))
+                    for session in sessions
+                ]
+            )
+        # Drop labels for sessions that fell off the list.
+        live = {(session.id, session.last_used_at) for session in sessions}
+        self._recent_labels = {key: label for key, label in self._recent_labels.items() if key in live}
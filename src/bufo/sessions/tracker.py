@@ -23,8 +23,16 @@ class SessionMeta:
 
 class SessionTracker:
     def __init__(self) -> None:
+        # Values stay in index order by construction: create() appends and
+        # dict pops preserve the order of the remaining entries, so all()
+        # never needs to sort.
         self._sessions: dict[str, SessionMeta] = {}
         self._next_index = 1
+        self._mode_index: dict[str, int] | None = None
+        self._sorted_cache: list[SessionMeta] | None = None
+        # Secondary index so routing incoming agent messages to a session
+        # is a dict lookup instead of a scan per message.
+        self._by_agent_pair: dict[tuple[str, str], SessionMeta] = {}
 
     def create(
         self,
@@ -49,17 +57,38 @@ class SessionTracker:
             agent_session_id=agent_session_id,
         )
         self._sessions[mode_name] = meta
+        self._mode_index = None
+        self._sorted_cache = None
+        if agent_identity and agent_session_id:
+            self._by_agent_pair[(agent_identity, agent_session_id)] = meta
         return meta
 
     def remove(self, mode_name: str) -> None:
-        self._sessions.pop(mode_name, None)
+        meta = self._sessions.pop(mode_name, None)
+        if meta is not None and meta.agent_identity and meta.agent_session_id:
+            self._by_agent_pair.pop((meta.agent_identity, meta.agent_session_id), None)
         self._reindex()
+        self._mode_index = None
+        self._sorted_cache = None
 
     def get(self, mode_name: str) -> SessionMeta | None:
         return self._sessions.get(mode_name)
 
     def all(self) -> list[SessionMeta]:
-        return sorted(self._sessions.values(), key=lambda item: item.index)
+        """Sessions in index order; treat the returned list as read-only."""
+        cached = self._sorted_cache
+        if cached is None:
+            cached = self._sorted_cache = list(self._sessions.values())
+        return cached
+
+    def mode_name_index(self) -> dict[str, int]:
+        """Mode name -> position in all(); cached until sessions change so
+        next/prev navigation stays O(1) regardless of session count."""
+        index = self._mode_index
+        if index is None:
+            index = {session.mode_name: position for position, session in enumerate(self.all())}
+            self._mode_index = index
+        return index
 
     def update_state(self, mode_name: str, state: SessionState) -> None:
         meta = self._sessions.get(mode_name)
@@ -67,15 +96,21 @@ class SessionTracker:
             return
         meta.state = state
 
+    def update_agent_pair(self, mode_name: str, agent_identity: str, agent_session_id: str) -> None:
+        """Record agent ids learned after creation, keeping the pair index
+        in sync; mutate SessionMeta through this rather than directly."""
+        meta = self._sessions.get(mode_name)
+        if meta is None:
+            return
+        if meta.agent_identity and meta.agent_session_id:
+            self._by_agent_pair.pop((meta.agent_identity, meta.agent_session_id), None)
+        meta.agent_identity = agent_identity
+        meta.agent_session_id = agent_session_id
+        self._by_agent_pair[(agent_identity, agent_session_id)] = meta
+
     def find_by_agent_pair(self, agent_identity: str, agent_session_id: str) -> SessionMeta | None:
-        for session in self._sessions.values():
-            if (
-                session.agent_identity == agent_identity
-                and session.agent_session_id == agent_session_id
-            ):
-                return session
-        return None
+        return self._by_agent_pair.get((agent_identity, agent_session_id))
 
     def _reindex(self) -> None:
-        for idx, session in enumerate(self.all()):
+        for idx, session in enumerate(self._sessions.values()):
             session.index = idx
@@ -35,26 +35,43 @@ class CommandRisk:
     reason: str
 
 
+# One lookup replaces the two membership checks, with the risk instance
+# prebuilt per token; callers treat CommandRisk as read-only.
+_RISK_BY_TOKEN: dict[str, CommandRisk] = {
+    **{
+        token: CommandRisk(level="destructive", reason=f"contains destructive command token '{token}'")
+        for token in DESTRUCTIVE_TOKENS
+    },
+    **{
+        token: CommandRisk(level="dangerous", reason=f"contains potentially mutating token '{token}'")
+        for token in DANGEROUS_TOKENS
+    },
+}
+
+_EMPTY_RISK = CommandRisk(level="safe", reason="empty command")
+_SAFE_RISK = CommandRisk(level="safe", reason="command appears non-mutating")
+_UNKNOWN_RISK = CommandRisk(level="unknown", reason="command not in known-safe allowlist")
+_PARENT_PATH_RISK = CommandRisk(
+    level="destructive", reason="targets parent path outside project context"
+)
+
+
 def classify_command(command: str, project_root: Path) -> CommandRisk:
     stripped = command.strip()
     if not stripped:
-        return CommandRisk(level="safe", reason="empty command")
-
-    first = stripped.split()[0]
-    if first in DESTRUCTIVE_TOKENS:
-        level = "destructive"
-        reason = f"contains destructive command token '{first}'"
-    elif first in DANGEROUS_TOKENS:
-        level = "dangerous"
-        reason = f"contains potentially mutating token '{first}'"
-    elif first.isalpha():
-        level = "unknown"
-        reason = "command not in known-safe allowlist"
-    else:
-        level = "safe"
-        reason = "command appears non-mutating"
-
-    if ".." in stripped and level in {"dangerous", "destructive"}:
-        return CommandRisk(level="destructive", reason="targets parent path outside project context")
-
-    return CommandRisk(level=level, reason=reason)
+        return _EMPTY_RISK
+
+    # maxsplit stops the tokenizer after the head instead of building a
+    # list of the whole tail; this runs per keystroke in the prompt preview.
+    first = stripped.split(None, 1)[0]
+    risk = _RISK_BY_TOKEN.get(first)
+    if risk is not None:
+        # Parent-path escape only escalates already-risky commands, so the
+        # substring scan is skipped entirely on the common safe path.
+        if ".." in stripped:
+            return _PARENT_PATH_RISK
+        return risk
+
+    if first.isalpha():
+        return _UNKNOWN_RISK
+    return _SAFE_RISK
@@ -5,6 +5,7 @@ from __future__ import annotations
 import json
 import platform
 import uuid
+from collections import deque
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from pathlib import Path
@@ -21,9 +22,15 @@ class TelemetryEvent:
 
 
 class Telemetry:
+    # Buffered lines flush once this many accumulate; the deque bound keeps
+    # a stuck sink from growing memory without limit.
+    FLUSH_THRESHOLD = 32
+
     def __init__(self, settings: AppSettings, sink_path: Path | None = None) -> None:
         self.settings = settings
         self.sink_path = sink_path or state_root() / "telemetry.jsonl"
+        self._buffer: deque[str] = deque(maxlen=256)
+        self._platform = platform.platform()
 
         if self.settings.statistics.distinct_id is None:
             self.settings.statistics.distinct_id = str(uuid.uuid4())
@@ -37,11 +44,22 @@ class Telemetry:
             "ts": datetime.now(UTC).isoformat(),
             "distinct_id": self.settings.statistics.distinct_id,
             "properties": {
-                "platform": platform.platform(),
+                "platform": self._platform,
                 **event.properties,
             },
         }
 
+        self._buffer.append(json.dumps(payload, sort_keys=True))
+        if len(self._buffer) >= self.FLUSH_THRESHOLD:
+            self.flush()
+
+    def flush(self) -> None:
+        """Append all buffered events to the sink in one write."""
+        if not self._buffer:
+            return
+
+        lines = list(self._buffer)
+        self._buffer.clear()
         self.sink_path.parent.mkdir(parents=True, exist_ok=True)
         with self.sink_path.open("a", encoding="utf-8") as f:
-            f.write(json.dumps(payload, sort_keys=True) + "\n")
+            f.write("\n".join(lines) + "\n")
@@ -8,13 +8,21 @@ from packaging.version import InvalidVersion, Version
 from bufo.version import __version__
 
 
-async def check_for_update(package_name: str = "bufo") -> str | None:
+async def check_for_update(
+    package_name: str = "bufo",
+    client: httpx.AsyncClient | None = None,
+) -> str | None:
+    """Check PyPI for a newer release. Pass a long-lived ``client`` to reuse
+    its connection pool; without one, a one-shot client is created."""
     url = f"https://pypi.org/pypi/{package_name}/json"
     try:
-        async with httpx.AsyncClient(timeout=2.5) as client:
+        if client is None:
+            async with httpx.AsyncClient(timeout=2.5) as owned:
+                response = await owned.get(url)
+        else:
             response = await client.get(url)
-            response.raise_for_status()
-            latest = response.json().get("info", {}).get("version")
+        response.raise_for_status()
+        latest = response.json().get("info", {}).get("version")
     except Exception:
         return None
 
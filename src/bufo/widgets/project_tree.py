@@ -114,7 +114,11 @@ class ProjectTreePanel(Vertical):
 
     def _watch_callback(self) -> None:
         self.logger.debug("project_tree.watch.callback", project_root=str(self.project_root))
-        self.app.call_from_thread(self.refresh_tree)
+        try:
+            self.app.call_from_thread(self.refresh_tree)
+        except RuntimeError:
+            # Already on the app's event loop (loop-based watch debouncing).
+            self.refresh_tree()
 
     def _collect_expanded_paths(self, node: Any) -> set[tuple[str, ...]]:
         expanded: set[tuple[str, ...]] = set()
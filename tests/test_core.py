@@ -7,6 +7,7 @@ import unittest
 from pathlib import Path
 from unittest.mock import patch
 
+from bufo.agents.catalog import AgentRegistry, _fingerprint
 from bufo.app import BufoApp
 from bufo.config.store import SettingsStore
 from bufo.fs.watch import NullWatchManager
@@ -63,6 +64,42 @@ class SessionStoreTests(unittest.TestCase):
             self.assertEqual(match.title, "A")
 
 
+class AgentRegistryCacheTests(unittest.TestCase):
+    def test_cache_hit_miss_and_invalidation(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            data_dir = root / "agents"
+            data_dir.mkdir()
+            catalog = data_dir / "default.toml"
+            catalog.write_text(
+                '[[agents]]\nidentity = "demo"\nname = "Demo"\n', encoding="utf-8"
+            )
+            registry = AgentRegistry(
+                data_dir,
+                custom_dir=root / "custom",
+                cache_path=root / "catalog.pickle",
+            )
+
+            first = registry.load()
+            self.assertEqual([agent.identity for agent in first.agents], ["demo"])
+            self.assertTrue(registry.cache_path.exists())
+
+            with patch("bufo.agents.catalog._parse_catalog") as parse:
+                second = registry.load()
+            parse.assert_not_called()
+            self.assertEqual([agent.identity for agent in second.agents], ["demo"])
+
+            catalog.write_text(
+                '[[agents]]\nidentity = "changed"\nname = "Changed"\n', encoding="utf-8"
+            )
+            third = registry.load()
+            self.assertEqual([agent.identity for agent in third.agents], ["changed"])
+
+    def test_failed_stat_is_a_cache_miss(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            self.assertIsNone(_fingerprint([Path(tmp) / "vanished.toml"]))
+
+
 class PromptResourceTests(unittest.TestCase):
     def test_text_resource_expansion(self) -> None:
         with tempfile.TemporaryDirectory() as tmp:
@@ -105,6 +142,35 @@ class JsonRpcTests(unittest.IsolatedAsyncioTestCase):
 
         self.assertEqual(result, {"ok": True})
 
+    async def test_same_tick_calls_coalesce_into_one_batch_frame(self) -> None:
+        outbound: list[str] = []
+
+        async def sender(line: str) -> None:
+            outbound.append(line)
+
+        conn = JsonRpcConnection(sender)
+
+        async def resolve() -> None:
+            while not outbound:
+                await asyncio.sleep(0)
+            frame = json.loads(outbound[0])
+            self.assertIsInstance(frame, list)
+            await conn.feed(
+                json.dumps(
+                    [
+                        {"jsonrpc": "2.0", "id": item["id"], "result": item["method"]}
+                        for item in frame
+                    ]
+                )
+            )
+
+        task = asyncio.create_task(resolve())
+        first, second = await asyncio.gather(conn.call("a"), conn.call("b"))
+        await task
+
+        self.assertEqual(len(outbound), 1)
+        self.assertEqual((first, second), ("a", "b"))
+
 
 class BufoAppBootstrapTests(unittest.TestCase):
     def test_falls_back_to_null_watch_manager_when_inotify_limit_hit(self) -> None: